@@ -0,0 +1,39 @@
+from django.test import TestCase
+from sams.models import Department, Program, Batch, AcademicYear, Semester, Course
+
+
+class AcademicFixtureTestCase(TestCase):
+    """Creates the department -> program -> batch -> academic year -> semester -> course chain once per class"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.department = Department.objects.create(
+            name='Computer Science',
+            code='CS'
+        )
+        cls.program = Program.objects.create(
+            name='Bachelor of Technology',
+            code='BTech'
+        )
+        cls.batch = Batch.objects.create(
+            year='2023-2025',
+            department=cls.department,
+            program=cls.program
+        )
+        cls.academic_year = AcademicYear.objects.create(
+            batch=cls.batch,
+            start_year=2023,
+            end_year=2024
+        )
+        cls.semester = Semester.objects.create(
+            academic_year=cls.academic_year,
+            number=1,
+            name='First Semester'
+        )
+        cls.course = Course.objects.create(
+            name='Introduction to Programming',
+            code='CS101',
+            credits=4,
+            department=cls.department,
+            semester=cls.semester
+        )
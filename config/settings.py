@@ -9,12 +9,17 @@ https://docs.djangoproject.com/en/5.2/topics/settings/
 For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
+import hashlib
 import os
+import sys
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# True while running the test suite, via 'manage.py test' or run_tests.py
+TESTING = sys.argv[1:2] == ['test'] or os.environ.get('DJANGO_TEST') == '1'
+
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.2/howto/deployment/checklist/
@@ -79,10 +84,24 @@ WSGI_APPLICATION = 'config.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# Runs that keep the test database (run_tests.py, or 'manage.py test --keepdb')
+# put it on tmpfs where available, so it never touches the disk but (unlike
+# Django's default in-memory test database) survives between runs. Parallel test
+# workers clone it next to it. /dev/shm is shared by the whole machine, so the
+# file name is tied to this checkout and user. Other runs use the in-memory
+# database, which never leaves a file behind to prompt about.
+TEST_DB_DIR = Path('/dev/shm')
+TEST_DB_SUFFIX = hashlib.sha1(f"{getattr(os, 'getuid', lambda: '')()}:{BASE_DIR}".encode()).hexdigest()[:12]
+TEST_KEEPDB = '--keepdb' in sys.argv or os.environ.get('DJANGO_TEST') == '1'
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'TEST': {
+            'NAME': TEST_DB_DIR / f'test_sams_{TEST_DB_SUFFIX}.sqlite3'
+            if TEST_KEEPDB and TEST_DB_DIR.is_dir() else None,
+        },
     }
 }
 
@@ -105,6 +124,24 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+if TESTING:
+    # The test database is thrown away, so skip SQLite's durability work on every write
+    DATABASES['default']['OPTIONS'] = {
+        'init_command': 'PRAGMA synchronous=OFF; PRAGMA journal_mode=MEMORY; PRAGMA temp_store=MEMORY',
+    }
+    # Hash strength doesn't matter for test users, and PBKDF2 dominates fixture setup
+    PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+    # Cached dashboard counts must not leak from one test into the next
+    CACHES = {'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}
+    # Keep test sessions in a signed cookie so logins and requests skip the session table
+    SESSION_ENGINE = 'django.contrib.sessions.backends.signed_cookies'
+    # Expected 403/404 responses would otherwise build a django.request log record each time
+    LOGGING = {
+        'version': 1,
+        'disable_existing_loggers': False,
+        'loggers': {'django': {'level': 'CRITICAL'}},
+    }
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
@@ -9,19 +9,34 @@ import os
 import sys
 import django
 from django.conf import settings
+from django.test.runner import get_max_test_processes
 from django.test.utils import get_runner
-from django.core.management import execute_from_command_line
+from django.core.management import call_command
 import subprocess
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+OUTPUT_TAIL_LINES = 2000
+
 def setup_django():
     """Setup Django environment for testing"""
     os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+    # Tests run inside this process, so settings can't detect them from argv
+    os.environ.setdefault('DJANGO_TEST', '1')
     django.setup()
 
+def subprocess_env():
+    """Environment for management commands run as subprocesses
+
+    DJANGO_TEST only describes this process; the migration and deploy checks
+    have to load the real settings, not the test overrides.
+    """
+    return {key: value for key, value in os.environ.items() if key != 'DJANGO_TEST'}
+
 def run_command(command, description):
-    """Run a command and return the result"""
+    """Run a command, streaming its output, and return the result"""
     print(f"\n{'='*60}")
     print(f"Running: {description}")
     print(f"Command: {command}")
@@ -29,85 +44,102 @@ def run_command(command, description):
     
     start_time = time.time()
     try:
-        result = subprocess.run(command, shell=True, capture_output=True, text=True)
+        # Print output as it arrives and only keep the tail for the caller,
+        # instead of buffering a whole verbose test run in memory
+        process = subprocess.Popen(
+            command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1,
+            env=subprocess_env()
+        )
+        tail = deque(maxlen=OUTPUT_TAIL_LINES)
+        for line in process.stdout:
+            sys.stdout.write(line)
+            tail.append(line)
+        returncode = process.wait()
         end_time = time.time()
         duration = end_time - start_time
         
         print(f"Duration: {duration:.2f} seconds")
-        print(f"Return code: {result.returncode}")
+        print(f"Return code: {returncode}")
         
-        if result.stdout:
-            print(f"\nSTDOUT:\n{result.stdout}")
-        if result.stderr:
-            print(f"\nSTDERR:\n{result.stderr}")
-            
-        return result.returncode == 0, result.stdout, result.stderr
+        return returncode == 0, ''.join(tail), ""
     except Exception as e:
         print(f"Error running command: {e}")
         return False, "", str(e)
 
-def run_specific_tests():
-    """Run specific test categories"""
-    test_commands = [
-        {
-            'command': 'python manage.py test test_models -v 2',
-            'description': 'Model Tests',
-            'file': 'test_models.py'
-        },
-        {
-            'command': 'python manage.py test test_forms -v 2',
-            'description': 'Form Tests',
-            'file': 'test_forms.py'
-        },
-        {
-            'command': 'python manage.py test test_views -v 2',
-            'description': 'View Tests',
-            'file': 'test_views.py'
-        },
-        {
-            'command': 'python manage.py test test_views_extended -v 2',
-            'description': 'Extended View Tests',
-            'file': 'test_views_extended.py'
-        },
-        {
-            'command': 'python manage.py test test_widgets -v 2',
-            'description': 'Widget Tests',
-            'file': 'test_widgets.py'
-        },
-        {
-            'command': 'python manage.py test test_integration -v 2',
-            'description': 'Integration Tests',
-            'file': 'test_integration.py'
-        },
-        {
-            'command': 'python manage.py test sams.tests -v 2',
-            'description': 'SAMS App Tests',
-            'file': 'sams/tests.py'
-        }
-    ]
+TEST_SUITES = [
+    {'label': 'test_models', 'description': 'Model Tests', 'file': 'test_models.py'},
+    {'label': 'test_forms', 'description': 'Form Tests', 'file': 'test_forms.py'},
+    {'label': 'test_views', 'description': 'View Tests', 'file': 'test_views.py'},
+    {'label': 'test_views_extended', 'description': 'Extended View Tests', 'file': 'test_views_extended.py'},
+    {'label': 'test_widgets', 'description': 'Widget Tests', 'file': 'test_widgets.py'},
+    {'label': 'test_integration', 'description': 'Integration Tests', 'file': 'test_integration.py'},
+    {'label': 'sams.tests', 'description': 'SAMS App Tests', 'file': 'sams/tests.py'},
+]
+
+def run_specific_tests(fresh=False):
+    """Run specific test categories in a single Django process"""
+    suites = []
+    for test_config in TEST_SUITES:
+        # Check if test file exists
+        if not os.path.exists(test_config['file']):
+            print(f"\nSkipping {test_config['description']} - File {test_config['file']} not found")
+            continue
+        suites.append(test_config)
     
     results = []
     total_start_time = time.time()
     
     print(f"Starting SAMS Test Suite at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
-    for test_config in test_commands:
-        # Check if test file exists
-        if not os.path.exists(test_config['file']):
-            print(f"\nSkipping {test_config['description']} - File {test_config['file']} not found")
-            continue
+    # Django is already set up in this process, so build one runner and share
+    # its test databases across every category instead of re-running manage.py
+    TestRunner = get_runner(settings)
+    # Non-interactive so --fresh replaces a kept test database without prompting
+    runner = TestRunner(verbosity=2, interactive=False, parallel=get_max_test_processes(), keepdb=not fresh)
+    runner.setup_test_environment()
+    
+    processes = runner.parallel
+    test_suites = []
+    databases = {}
+    for test_config in suites:
+        # build_suite() lowers runner.parallel to the processes this suite needs
+        runner.parallel = processes
+        suite = runner.build_suite([test_config['label']])
+        test_suites.append((test_config, suite, runner.parallel))
+        for alias, serialize in runner.get_databases(suite).items():
+            databases[alias] = databases.get(alias, False) or serialize
+    
+    # Clone enough test databases for the largest parallel suite
+    runner.parallel = max((parallel for _, _, parallel in test_suites), default=1)
+    serialized_aliases = {alias for alias, serialize in databases.items() if serialize}
+    old_config = runner.setup_databases(aliases=databases, serialized_aliases=serialized_aliases)
+    
+    try:
+        runner.run_checks(databases)
+        for test_config, suite, _ in test_suites:
+            suite.serialized_aliases = serialized_aliases
+            suite.used_aliases = set(databases)
             
-        success, stdout, stderr = run_command(
-            test_config['command'], 
-            test_config['description']
-        )
-        
-        results.append({
-            'description': test_config['description'],
-            'success': success,
-            'stdout': stdout,
-            'stderr': stderr
-        })
+            print(f"\n{'='*60}")
+            print(f"Running: {test_config['description']}")
+            print(f"Labels: {test_config['label']}")
+            print(f"{'='*60}")
+            
+            start_time = time.perf_counter()
+            result = runner.run_suite(suite)
+            duration = time.perf_counter() - start_time
+            
+            print(f"Duration: {duration:.2f} seconds")
+            
+            results.append({
+                'description': test_config['description'],
+                'success': result.wasSuccessful(),
+                'tests_run': result.testsRun,
+                'duration': duration
+            })
+    finally:
+        runner.teardown_databases(old_config)
+        runner.teardown_test_environment()
     
     total_end_time = time.time()
     total_duration = total_end_time - total_start_time
@@ -134,51 +166,90 @@ def run_specific_tests():
     print(f"\nDETAILED RESULTS:")
     for result in results:
         status = "✅ PASSED" if result['success'] else "❌ FAILED"
-        print(f"  {status} - {result['description']}")
+        print(f"  {status} - {result['description']} ({result['tests_run']} tests, {result['duration']:.2f}s)")
     
     return failed == 0
 
-def run_coverage_analysis():
-    """Run test coverage analysis"""
+def run_test_label(label, description, fresh=False):
+    """Run a single test label through the test command in this process"""
     print(f"\n{'='*60}")
-    print("Running Coverage Analysis")
+    print(f"Running: {description}")
+    print(f"Labels: {label}")
     print(f"{'='*60}")
     
+    start_time = time.time()
+    try:
+        call_command('test', label, verbosity=2, interactive=False,
+                     parallel=get_max_test_processes(), keepdb=not fresh)
+        success = True
+    except SystemExit as e:
+        # The test command exits with a non-zero code when tests fail
+        success = not e.code
+    duration = time.time() - start_time
+    
+    print(f"Duration: {duration:.2f} seconds")
+    return success
+
+COVERAGE_LABELS = ['test_models', 'test_forms', 'test_views', 'test_integration', 'sams.tests']
+
+def start_coverage():
+    """Start measuring sams before django.setup() imports it"""
     # Install coverage if not available
     try:
         import coverage
     except ImportError:
         print("Installing coverage package...")
         subprocess.run([sys.executable, '-m', 'pip', 'install', 'coverage'], check=True)
+        import coverage
     
-    # Run coverage
-    commands = [
-        'coverage erase',
-        'coverage run --source=sams manage.py test test_models test_forms test_views test_integration sams.tests',
-        'coverage report -m',
-        'coverage html'
-    ]
-    
-    for cmd in commands:
-        success, stdout, stderr = run_command(cmd, f"Coverage: {cmd}")
-        if not success and 'coverage run' in cmd:
-            print("Coverage analysis failed, but continuing...")
+    cov = coverage.Coverage(source=['sams'])
+    cov.erase()
+    cov.start()
+    return cov
 
-def run_linting():
-    """Run code quality checks"""
+def run_coverage_analysis(cov, fresh=False):
+    """Run test coverage analysis"""
     print(f"\n{'='*60}")
-    print("Running Code Quality Checks")
+    print("Running Coverage Analysis")
     print(f"{'='*60}")
     
-    # Check if flake8 is available
+    # Measure a serial run of the tests in this process; module-level lines
+    # were already recorded while Django imported the app
+    cov.start()
+    try:
+        TestRunner = get_runner(settings)
+        runner = TestRunner(verbosity=2, interactive=False, keepdb=not fresh)
+        failures = runner.run_tests(COVERAGE_LABELS)
+    finally:
+        cov.stop()
+        cov.save()
+    
+    if failures:
+        print("Coverage analysis failed, but continuing...")
+    
+    cov.report(show_missing=True)
+    cov.html_report()
+
+LINT_COMMAND = 'flake8 sams/ --max-line-length=120 --exclude=migrations'
+MIGRATIONS_COMMAND = 'python manage.py makemigrations --dry-run --check'
+SECURITY_COMMAND = 'python manage.py check --deploy'
+
+def flake8_available():
+    """Check if flake8 is available"""
     try:
         subprocess.run(['flake8', '--version'], capture_output=True, check=True)
-        flake8_available = True
+        return True
     except (subprocess.CalledProcessError, FileNotFoundError):
-        flake8_available = False
+        return False
+
+def run_linting():
+    """Run code quality checks"""
+    print(f"\n{'='*60}")
+    print("Running Code Quality Checks")
+    print(f"{'='*60}")
     
-    if flake8_available:
-        run_command('flake8 sams/ --max-line-length=120 --exclude=migrations', 'Flake8 Linting')
+    if flake8_available():
+        run_command(LINT_COMMAND, 'Flake8 Linting')
     else:
         print("Flake8 not available, skipping linting")
 
@@ -188,7 +259,7 @@ def check_migrations():
     print("Checking Migrations")
     print(f"{'='*60}")
     
-    run_command('python manage.py makemigrations --dry-run --check', 'Check for pending migrations')
+    run_command(MIGRATIONS_COMMAND, 'Check for pending migrations')
 
 def run_security_checks():
     """Run Django security checks"""
@@ -196,48 +267,99 @@ def run_security_checks():
     print("Running Security Checks")
     print(f"{'='*60}")
     
-    run_command('python manage.py check --deploy', 'Django Security Check')
+    run_command(SECURITY_COMMAND, 'Django Security Check')
+
+def _run_one(check_config):
+    """Run a command without printing and return (description, success, stdout, stderr, duration)"""
+    start_time = time.time()
+    try:
+        result = subprocess.run(
+            check_config['command'], shell=True, capture_output=True, text=True, env=subprocess_env()
+        )
+        duration = time.time() - start_time
+        return check_config['description'], result.returncode == 0, result.stdout, result.stderr, duration
+    except Exception as e:
+        return check_config['description'], False, "", str(e), time.time() - start_time
+
+def run_additional_checks():
+    """Run migration, security and lint checks concurrently"""
+    check_commands = [
+        {'command': MIGRATIONS_COMMAND, 'description': 'Check for pending migrations'},
+        {'command': SECURITY_COMMAND, 'description': 'Django Security Check'},
+    ]
+    if flake8_available():
+        check_commands.append({'command': LINT_COMMAND, 'description': 'Flake8 Linting'})
+    else:
+        print("Flake8 not available, skipping linting")
+    
+    # The checks are independent, so run them side by side and print the
+    # results afterwards in a stable order
+    with ThreadPoolExecutor(max_workers=min(len(check_commands), os.cpu_count() or 1)) as executor:
+        outcomes = list(executor.map(_run_one, check_commands))
+    
+    for description, success, stdout, stderr, duration in outcomes:
+        print(f"\n{'='*60}")
+        print(f"Running: {description}")
+        print(f"{'='*60}")
+        print(f"Duration: {duration:.2f} seconds")
+        print(f"Result: {'OK' if success else 'FAILED'}")
+        if stdout:
+            print(f"\nSTDOUT:\n{stdout}")
+        if stderr:
+            print(f"\nSTDERR:\n{stderr}")
 
 def main():
     """Main test runner function"""
     print("SAMS Test Suite Runner")
     print("=" * 80)
     
+    # Parse command line arguments
+    fresh = '--fresh' in sys.argv
+    full = '--full' in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg not in ('--fresh', '--full')]
+    
+    # Coverage has to be recording while Django imports the app, and is
+    # paused again until the coverage run itself
+    cov = start_coverage() if (not args and full) or args[:1] == ['--coverage'] else None
+    
     # Setup Django
     setup_django()
     
-    # Parse command line arguments
-    if len(sys.argv) > 1:
-        if sys.argv[1] == '--models':
-            run_command('python manage.py test test_models -v 2', 'Model Tests Only')
-        elif sys.argv[1] == '--forms':
-            run_command('python manage.py test test_forms -v 2', 'Form Tests Only')
-        elif sys.argv[1] == '--views':
-            run_command('python manage.py test test_views -v 2', 'View Tests Only')
-        elif sys.argv[1] == '--integration':
-            run_command('python manage.py test test_integration -v 2', 'Integration Tests Only')
-        elif sys.argv[1] == '--coverage':
-            run_coverage_analysis()
-        elif sys.argv[1] == '--lint':
+    if cov:
+        cov.stop()
+    
+    if args:
+        if args[0] == '--models':
+            run_test_label('test_models', 'Model Tests Only', fresh)
+        elif args[0] == '--forms':
+            run_test_label('test_forms', 'Form Tests Only', fresh)
+        elif args[0] == '--views':
+            run_test_label('test_views', 'View Tests Only', fresh)
+        elif args[0] == '--integration':
+            run_test_label('test_integration', 'Integration Tests Only', fresh)
+        elif args[0] == '--coverage':
+            run_coverage_analysis(cov, fresh)
+        elif args[0] == '--lint':
             run_linting()
-        elif sys.argv[1] == '--security':
+        elif args[0] == '--security':
             run_security_checks()
-        elif sys.argv[1] == '--migrations':
+        elif args[0] == '--migrations':
             check_migrations()
-        elif sys.argv[1] == '--help':
+        elif args[0] == '--help':
             print_help()
         else:
-            print(f"Unknown option: {sys.argv[1]}")
+            print(f"Unknown option: {args[0]}")
             print_help()
     else:
         # Run all tests
-        success = run_specific_tests()
+        success = run_specific_tests(fresh)
         
         # Run additional checks
-        check_migrations()
-        run_security_checks()
-        run_linting()
-        run_coverage_analysis()
+        if full:
+            run_additional_checks()
+            run_coverage_analysis(cov, fresh)
+        else:
+            print("\nSkipping migration, security, lint and coverage checks (use --full to run them)")
         
         if success:
             print(f"\n🎉 All tests passed! 🎉")
@@ -263,8 +385,10 @@ Options:
   --security    Run security checks only
   --migrations  Check for pending migrations only
   --help        Show this help message
+  --fresh       Rebuild the test database instead of reusing it (--keepdb)
+  --full        Also run the migration, security, lint and coverage checks
 
-No option: Run all tests and checks
+No option: Run all tests
 """
     print(help_text)
 
@@ -1,31 +1,45 @@
 from django import forms
 from .models import *
 from .widgets import *
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 
 class DeduplicationMixin:
     def save(self, commit=True):
         try:
             return super().save(commit=commit)
         except IntegrityError:
-            self.add_error(None, "Duplicate entry already exists.")
+            self.add_error(None, forms.ValidationError("Duplicate entry already exists.", code='duplicate'))
             raise
 
 class BootstrapFormMixin:
     def __init__(self, *args, **kwargs):
+        # Style the class-level fields once; every instance deep-copies them
+        if '_bootstrap_styled' not in type(self).__dict__:
+            type(self)._apply_bootstrap_classes()
         super().__init__(*args, **kwargs)
-        for field_name, field in self.fields.items():
+
+    @classmethod
+    def _apply_bootstrap_classes(cls):
+        for field_name, field in cls.base_fields.items():
             widget = field.widget
             if isinstance(widget, (forms.TextInput, forms.PasswordInput, forms.EmailInput, forms.NumberInput, forms.Select, forms.SelectMultiple)):
                 css_class = 'form-control' if not isinstance(widget, forms.SelectMultiple) else 'form-select'
-                existing_classes = widget.attrs.get('class', '')
-                widget.attrs['class'] = f'{existing_classes} {css_class}'.strip()
+                existing_classes = widget.attrs.get('class')
+                if not existing_classes:
+                    widget.attrs['class'] = css_class
+                # Declared fields are shared with subclasses, which style them again
+                elif css_class not in existing_classes.split():
+                    widget.attrs['class'] = f'{existing_classes} {css_class}'
+        cls._bootstrap_styled = True
 
 
 class StudentCreationForm(BootstrapFormMixin, DeduplicationMixin, forms.ModelForm):
     password1 = forms.CharField(label="Password", widget=forms.PasswordInput)
     password2 = forms.CharField(label="Confirm Password", widget=forms.PasswordInput)
-    batch = forms.ModelChoiceField(queryset=Batch.objects.all(), widget=forms.Select())
+    batch = forms.ModelChoiceField(
+        queryset=Batch.objects.select_related('department', 'program'),
+        widget=forms.Select()
+    )
 
     class Meta:
         model = User
@@ -42,8 +56,10 @@ class StudentCreationForm(BootstrapFormMixin, DeduplicationMixin, forms.ModelFor
         user.set_password(self.cleaned_data["password1"])
         user.role = 'student'
         if commit:
-            user.save()
-            StudentProfile.objects.create(user=user, batch=self.cleaned_data['batch'])
+            # The user and its profile are written together or not at all
+            with transaction.atomic():
+                user.save()
+                StudentProfile.objects.create(user=user, batch=self.cleaned_data['batch'])
         return user
 
 
@@ -78,24 +94,24 @@ class AssignTeacherForm(BootstrapFormMixin, DeduplicationMixin, forms.ModelForm)
 
 class BulkEnrollStudentsForm(BootstrapFormMixin, forms.Form):
     batch = forms.ModelChoiceField(
-        queryset=Batch.objects.all(), 
+        queryset=Batch.objects.select_related('department', 'program'),
         label="Select Batch",
         widget=SearchableSelect()
     )
     semester = forms.ModelChoiceField(
-        queryset=Semester.objects.all(), 
+        queryset=Semester.objects.select_related('academic_year__batch'),
         label="Select Semester",
         widget=SearchableSelect()
     )
     
     students = forms.ModelMultipleChoiceField(
-        queryset=User.objects.filter(role='student'), 
+        queryset=User.objects.filter(role='student').only('id', 'username', 'role'),
         widget=CustomCheckboxSelectMultiple(),
         required=False,
         label="Select Students"
     )
     courses = forms.ModelMultipleChoiceField(
-        queryset=Course.objects.all(),
+        queryset=Course.objects.only('id', 'code', 'name'),
         widget=CustomCheckboxSelectMultiple(),
         required=False,
         label="Select Courses"
@@ -139,7 +155,10 @@ class SemesterForm(BootstrapFormMixin, DeduplicationMixin, forms.ModelForm):
 
 
 class StudentUpdateForm(BootstrapFormMixin, forms.ModelForm):
-    batch = forms.ModelChoiceField(queryset=Batch.objects.all(), widget=forms.Select())
+    batch = forms.ModelChoiceField(
+        queryset=Batch.objects.select_related('department', 'program'),
+        widget=forms.Select()
+    )
 
     class Meta:
         model = User
@@ -151,14 +170,15 @@ class StudentUpdateForm(BootstrapFormMixin, forms.ModelForm):
             self.fields['batch'].initial = self.instance.studentprofile.batch
 
     def save(self, commit=True):
-        user = super().save(commit=commit)
-        if commit:
-            # Update batch
-            if hasattr(user, 'studentprofile'):
-                user.studentprofile.batch = self.cleaned_data['batch']
-                user.studentprofile.save()
-            else:
-                StudentProfile.objects.create(user=user, batch=self.cleaned_data['batch'])
+        with transaction.atomic():
+            user = super().save(commit=commit)
+            if commit:
+                # Update batch
+                if hasattr(user, 'studentprofile'):
+                    user.studentprofile.batch = self.cleaned_data['batch']
+                    user.studentprofile.save()
+                else:
+                    StudentProfile.objects.create(user=user, batch=self.cleaned_data['batch'])
         return user
 
 
@@ -169,26 +189,20 @@ class TeacherUpdateForm(BootstrapFormMixin, forms.ModelForm):
 
 
 class EnrollStudentForm(BootstrapFormMixin, DeduplicationMixin, forms.ModelForm):
+    student = forms.ModelChoiceField(queryset=User.objects.filter(role='student').only('id', 'username', 'role'))
+    course = forms.ModelChoiceField(queryset=Course.objects.only('id', 'code', 'name'))
+    academic_year = forms.ModelChoiceField(queryset=AcademicYear.objects.select_related('batch'))
+
     class Meta:
         model = StudentCourse
         fields = ['student', 'course', 'academic_year']
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.fields['student'].queryset = User.objects.filter(role='student')
-
 
 class TeacherCourseUpdateForm(BootstrapFormMixin, forms.ModelForm):
+    teacher = forms.ModelChoiceField(queryset=User.objects.filter(role='teacher').only('id', 'username', 'role'))
+    course = forms.ModelChoiceField(queryset=Course.objects.only('id', 'code', 'name'))
+    academic_year = forms.ModelChoiceField(queryset=AcademicYear.objects.select_related('batch'))
+
     class Meta:
         model = TeacherCourse
         fields = ['teacher', 'course', 'academic_year']
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.fields['teacher'].queryset = User.objects.filter(role='teacher')
-
-
-
-
-
-
@@ -0,0 +1,64 @@
+# Generated by Django 5.2.4 on 2026-10-16 09:40
+
+import sams.models
+from django.db import migrations, models
+
+STATUS_CODES = ['present', 'absent', 'late']
+
+
+def status_to_code(apps, schema_editor):
+    Attendance = apps.get_model('sams', 'Attendance')
+    for code, status in enumerate(STATUS_CODES):
+        Attendance.objects.filter(status=status).update(status_code=code)
+    # Unknown statuses were never valid choices; record them as absent,
+    # which is what mark_attendance defaults to
+    Attendance.objects.filter(status_code__isnull=True).update(status_code=STATUS_CODES.index('absent'))
+
+
+def code_to_status(apps, schema_editor):
+    Attendance = apps.get_model('sams', 'Attendance')
+    for code, status in enumerate(STATUS_CODES):
+        Attendance.objects.filter(status_code=code).update(status=status)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sams', '0002_attendance_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='attendance',
+            name='attendance_session_status_idx',
+        ),
+        migrations.AddField(
+            model_name='attendance',
+            name='status_code',
+            field=models.PositiveSmallIntegerField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='attendance',
+            name='status',
+            field=models.CharField(choices=[('present', 'Present'), ('absent', 'Absent'), ('late', 'Late')], max_length=10, null=True),
+        ),
+        migrations.RunPython(status_to_code, code_to_status),
+        migrations.RemoveField(
+            model_name='attendance',
+            name='status',
+        ),
+        migrations.RenameField(
+            model_name='attendance',
+            old_name='status_code',
+            new_name='status',
+        ),
+        migrations.AlterField(
+            model_name='attendance',
+            name='status',
+            field=sams.models.AttendanceStatusField(choices=[('present', 'Present'), ('absent', 'Absent'), ('late', 'Late')]),
+        ),
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['session', 'status'], name='attendance_session_status_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.4 on 2026-10-16 10:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sams', '0003_attendance_status_smallint'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='attendancesession',
+            unique_together=set(),
+        ),
+        migrations.RemoveIndex(
+            model_name='attendancesession',
+            name='session_course_year_date_idx',
+        ),
+        migrations.AddConstraint(
+            model_name='attendancesession',
+            constraint=models.UniqueConstraint(fields=('course', 'academic_year', 'date', 'start_time'), name='unique_attendance_session'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-16 10:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sams', '0004_attendancesession_unique_constraint'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='role',
+            field=models.CharField(choices=[('admin', 'Admin'), ('teacher', 'Teacher'), ('student', 'Student')], db_index=True, max_length=10),
+        ),
+    ]
@@ -2,6 +2,7 @@ from django.db import models
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
+from django.utils.functional import cached_property
 
 class User(AbstractUser):
     ROLE_CHOICES = [
@@ -9,7 +10,7 @@ class User(AbstractUser):
         ('teacher', 'Teacher'),
         ('student', 'Student'),
     ]
-    role = models.CharField(max_length=10, choices=ROLE_CHOICES)
+    role = models.CharField(max_length=10, choices=ROLE_CHOICES, db_index=True)
     employee_id = models.CharField(max_length=20, unique=True, null=True, blank=True)
     student_id = models.CharField(max_length=20, unique=True, null=True, blank=True)
     phone = models.CharField(max_length=15, blank=True)
@@ -97,6 +98,10 @@ class StudentCourse(models.Model):
 
     class Meta:
         unique_together = ['student', 'course', 'academic_year']
+        indexes = [
+            models.Index(fields=['student', 'academic_year'], name='studentcourse_student_year_idx'),
+            models.Index(fields=['course', 'academic_year'], name='studentcourse_course_year_idx'),
+        ]
     
     def __str__(self):
         return f"{self.student.username} - {self.course.code}"
@@ -111,11 +116,53 @@ class AttendanceSession(models.Model):
     topic = models.CharField(max_length=200, blank=True)
 
     class Meta:
-        unique_together = ['course', 'date', 'start_time', 'academic_year']
+        # Column order puts course and academic year first, so the unique index
+        # also serves "sessions of a course in a year" lookups and date ranges
+        constraints = [
+            models.UniqueConstraint(
+                fields=['course', 'academic_year', 'date', 'start_time'],
+                name='unique_attendance_session',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['date', 'course'], name='session_date_course_idx'),
+        ]
     
     def __str__(self):
         return f"{self.course.code} - {self.date} ({self.start_time})"
 
+class AttendanceStatusField(models.PositiveSmallIntegerField):
+    """Status code stored as a small integer column.
+
+    Python code, forms and query lookups keep using the string codes
+    ('present', 'absent', 'late'); only the database value is numeric.
+    """
+    CODES = ['present', 'absent', 'late']
+
+    @cached_property
+    def validators(self):
+        # The integer range validators don't apply to the string codes
+        return [*self.default_validators, *self._validators]
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return self.CODES[value]
+
+    def to_python(self, value):
+        if isinstance(value, int) and not isinstance(value, bool) and 0 <= value < len(self.CODES):
+            return self.CODES[value]
+        return value
+
+    def get_prep_value(self, value):
+        value = models.Field.get_prep_value(self, value)
+        if value is None or isinstance(value, int):
+            return value
+        try:
+            return self.CODES.index(value)
+        except ValueError:
+            raise ValueError(f"Field '{self.name}' expected one of {self.CODES} but got {value!r}.")
+
 class Attendance(models.Model):
     STATUS_CHOICES = [
         ('present', 'Present'),
@@ -125,12 +172,17 @@ class Attendance(models.Model):
     
     session = models.ForeignKey(AttendanceSession, on_delete=models.CASCADE)
     student = models.ForeignKey(User, on_delete=models.CASCADE, limit_choices_to={'role': 'student'})
-    status = models.CharField(max_length=10, choices=STATUS_CHOICES)
+    status = AttendanceStatusField(choices=STATUS_CHOICES)
     marked_at = models.DateTimeField(auto_now_add=True)
     marked_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='marked_attendances')
     
     class Meta:
         unique_together = ['session', 'student']
+        indexes = [
+            models.Index(fields=['session', 'status'], name='attendance_session_status_idx'),
+            models.Index(fields=['student', 'session'], name='attendance_student_session_idx'),
+            models.Index(fields=['student', 'status'], name='attendance_student_status_idx'),
+        ]
     
     def __str__(self):
         return f"{self.student.username} - {self.session} - {self.status}"
\ No newline at end of file
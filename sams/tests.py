@@ -1,5 +1,6 @@
 from django.test import TestCase
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from django.urls import reverse
 from django.utils import timezone
 from .models import *
@@ -9,23 +10,14 @@ User = get_user_model()
 class BasicSAMSTest(TestCase):
     """Basic tests for SAMS functionality"""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data"""
-        self.admin = User.objects.create_user(
-            username='admin',
-            password='admin123',
-            role='admin'
-        )
-        self.teacher = User.objects.create_user(
-            username='teacher',
-            password='teacher123',
-            role='teacher'
-        )
-        self.student = User.objects.create_user(
-            username='student',
-            password='student123',
-            role='student'
-        )
+        cls.admin, cls.teacher, cls.student = User.objects.bulk_create([
+            User(username='admin', password=make_password('admin123'), role='admin'),
+            User(username='teacher', password=make_password('teacher123'), role='teacher'),
+            User(username='student', password=make_password('student123'), role='student'),
+        ])
 
     def test_user_creation(self):
         """Test that users are created with correct roles"""
@@ -47,19 +39,20 @@ class BasicSAMSTest(TestCase):
 class ModelRelationshipTest(TestCase):
     """Test model relationships and constraints"""
     
-    def setUp(self):
-        self.department = Department.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.department = Department.objects.create(
             name='Computer Science',
             code='CS'
         )
-        self.program = Program.objects.create(
+        cls.program = Program.objects.create(
             name='Bachelor of Technology',
             code='BTech'
         )
-        self.batch = Batch.objects.create(
+        cls.batch = Batch.objects.create(
             year='2023-2025',
-            department=self.department,
-            program=self.program
+            department=cls.department,
+            program=cls.program
         )
 
     def test_department_creation(self):
@@ -76,39 +69,40 @@ class ModelRelationshipTest(TestCase):
 class AttendanceFlowTest(TestCase):
     """Test basic attendance flow"""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         # Create basic structure
-        self.department = Department.objects.create(name='CS', code='CS')
-        self.program = Program.objects.create(name='BTech', code='BTech')
-        self.batch = Batch.objects.create(
+        cls.department = Department.objects.create(name='CS', code='CS')
+        cls.program = Program.objects.create(name='BTech', code='BTech')
+        cls.batch = Batch.objects.create(
             year='2023-2025',
-            department=self.department,
-            program=self.program
+            department=cls.department,
+            program=cls.program
         )
-        self.academic_year = AcademicYear.objects.create(
-            batch=self.batch,
+        cls.academic_year = AcademicYear.objects.create(
+            batch=cls.batch,
             start_year=2023,
             end_year=2024
         )
-        self.semester = Semester.objects.create(
-            academic_year=self.academic_year,
+        cls.semester = Semester.objects.create(
+            academic_year=cls.academic_year,
             number=1
         )
-        self.course = Course.objects.create(
+        cls.course = Course.objects.create(
             name='Test Course',
             code='CS101',
             credits=3,
-            department=self.department,
-            semester=self.semester
+            department=cls.department,
+            semester=cls.semester
         )
         
         # Create users
-        self.teacher = User.objects.create_user(
+        cls.teacher = User.objects.create_user(
             username='teacher',
             password='teacher123',
             role='teacher'
         )
-        self.student = User.objects.create_user(
+        cls.student = User.objects.create_user(
             username='student',
             password='student123',
             role='student'
@@ -11,16 +11,17 @@ urlpatterns = [
     path('', views.dashboard, name='dashboard'),
 
     # Admin: User Management
-    path('administrator/create-student/', views.create_student, name='create_student'),
-    path('administrator/create-teacher/', views.create_teacher, name='create_teacher'),
+    path('administrator/create-student/', views.create_entity, {'entity': 'student'}, name='create_student'),
+    path('administrator/create-teacher/', views.create_entity, {'entity': 'teacher'}, name='create_teacher'),
 
     # administrator: Entity Creation
-    path('administrator/create-department/', views.create_department, name='create_department'),
-    path('administrator/create-course/', views.create_course, name='create_course'),
-    path('administrator/create-batch/', views.create_batch, name='create_batch'),
-    path('administrator/create-program/', views.create_program, name='create_program'),
-    path('administrator/create-academic-year/', views.create_academic_year, name='create_academic_year'),
-    path('administrator/create-semester/', views.create_semester, name='create_semester'),
+    path('administrator/create-department/', views.create_entity, {'entity': 'department'}, name='create_department'),
+    path('administrator/create-course/', views.create_entity, {'entity': 'course'}, name='create_course'),
+    path('administrator/create-batch/', views.create_entity, {'entity': 'batch'}, name='create_batch'),
+    path('administrator/create-program/', views.create_entity, {'entity': 'program'}, name='create_program'),
+    path('administrator/create-academic-year/', views.create_entity,
+         {'entity': 'academic_year'}, name='create_academic_year'),
+    path('administrator/create-semester/', views.create_entity, {'entity': 'semester'}, name='create_semester'),
 
     # administrator: Assignments & Reports
     path('administrator/assign-teacher/', views.assign_teacher_course, name='assign_teacher_course'),
@@ -1,10 +1,17 @@
+from functools import wraps
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Avg, Case, Count, FloatField, Q, Value, When
 from .forms import *
 
 def role_required(allowed_roles):
+    allowed_roles = frozenset(allowed_roles)
+
     def decorator(view_func):
+        @wraps(view_func)
         def wrapper(request, *args, **kwargs):
             if request.user.role not in allowed_roles:
                 messages.error(request, "You don't have permission to access this page.")
@@ -13,45 +20,64 @@ def role_required(allowed_roles):
         return wrapper
     return decorator
 
+ADMIN_STATS_CACHE_KEY = 'admin_dashboard_stats_v1'
+ADMIN_STATS_TIMEOUT = 60  # seconds
+
+def _compute_admin_stats():
+    # Basic counts
+    user_counts = User.objects.aggregate(
+        students=Count('id', filter=Q(role='student')),
+        teachers=Count('id', filter=Q(role='teacher')),
+    )
+    total_students = user_counts['students']
+    total_teachers = user_counts['teachers']
+    total_courses = Course.objects.count()
+    total_departments = Department.objects.count()
+    total_batches = Batch.objects.count()
+    total_programs = Program.objects.count()
+    total_academic_years = AcademicYear.objects.count()
+    total_semesters = Semester.objects.count()
+    
+    # Analytics data
+    total_enrollments = StudentCourse.objects.count()
+    total_assignments = TeacherCourse.objects.count()
+    total_sessions = AttendanceSession.objects.count()
+    
+    # Calculate average attendance
+    avg_attendance = Attendance.objects.aggregate(
+        avg=Avg(Case(
+            When(status__in=['present', 'late'], then=Value(100.0)),
+            default=Value(0.0),
+            output_field=FloatField(),
+        )),
+    )['avg']
+    avg_attendance = round(avg_attendance, 1) if avg_attendance is not None else 0
+    
+    return {
+        'total_students': total_students,
+        'total_teachers': total_teachers,
+        'total_courses': total_courses,
+        'total_departments': total_departments,
+        'total_batches': total_batches,
+        'total_programs': total_programs,
+        'total_academic_years': total_academic_years,
+        'total_semesters': total_semesters,
+        'total_enrollments': total_enrollments,
+        'total_assignments': total_assignments,
+        'total_sessions': total_sessions,
+        'avg_attendance': avg_attendance,
+    }
+
+def invalidate_admin_stats():
+    cache.delete(ADMIN_STATS_CACHE_KEY)
+
 @login_required
 def dashboard(request):
     context = {'user': request.user}
     
     if request.user.role == 'admin':
-        # Basic counts
-        total_students = User.objects.filter(role='student').count()
-        total_teachers = User.objects.filter(role='teacher').count()
-        total_courses = Course.objects.count()
-        total_departments = Department.objects.count()
-        total_batches = Batch.objects.count()
-        total_programs = Program.objects.count()
-        total_academic_years = AcademicYear.objects.count()
-        total_semesters = Semester.objects.count()
-        
-        # Analytics data
-        total_enrollments = StudentCourse.objects.count()
-        total_assignments = TeacherCourse.objects.count()
-        total_sessions = AttendanceSession.objects.count()
-        
-        # Calculate average attendance
-        total_attendance_records = Attendance.objects.count()
-        present_records = Attendance.objects.filter(status__in=['present', 'late']).count()
-        avg_attendance = round((present_records / total_attendance_records * 100), 1) if total_attendance_records > 0 else 0
-        
-        context.update({
-            'total_students': total_students,
-            'total_teachers': total_teachers,
-            'total_courses': total_courses,
-            'total_departments': total_departments,
-            'total_batches': total_batches,
-            'total_programs': total_programs,
-            'total_academic_years': total_academic_years,
-            'total_semesters': total_semesters,
-            'total_enrollments': total_enrollments,
-            'total_assignments': total_assignments,
-            'total_sessions': total_sessions,
-            'avg_attendance': avg_attendance,
-        })
+        # The counts change slowly, so recompute them at most once a minute
+        context.update(cache.get_or_set(ADMIN_STATS_CACHE_KEY, _compute_admin_stats, ADMIN_STATS_TIMEOUT))
         return render(request, 'attendance/admin_dashboard.html', context)
     
     elif request.user.role == 'teacher':
@@ -63,7 +89,25 @@ def dashboard(request):
         return render(request, 'attendance/teacher_dashboard.html', context)
     
     elif request.user.role == 'student':
-        student_courses = StudentCourse.objects.filter(student=request.user).select_related('course__semester')
+        student_courses = StudentCourse.objects.filter(student=request.user).select_related(
+            'course__semester__academic_year__batch', 'course__department'
+        )
+        course_ids = {sc.course_id for sc in student_courses}
+        
+        # Count sessions and attendance for all courses in two grouped queries
+        session_totals = {
+            (row['course_id'], row['academic_year_id']): row['total']
+            for row in AttendanceSession.objects.filter(course_id__in=course_ids)
+            .values('course_id', 'academic_year_id')
+            .annotate(total=Count('id'))
+        }
+        attended_counts = dict(
+            Attendance.objects.filter(
+                session__course_id__in=course_ids,
+                student=request.user,
+                status__in=['present', 'late']
+            ).values_list('session__course_id').annotate(attended=Count('id'))
+        )
         
         # Group courses by semester
         semester_courses = {}
@@ -73,16 +117,8 @@ def dashboard(request):
             if semester not in semester_courses:
                 semester_courses[semester] = []
             
-            total_sessions = AttendanceSession.objects.filter(
-                course=sc.course, 
-                academic_year=sc.academic_year
-            ).count()
-            
-            attended_sessions = Attendance.objects.filter(
-                session__course=sc.course,
-                student=request.user,
-                status__in=['present', 'late']
-            ).count()
+            total_sessions = session_totals.get((sc.course_id, sc.academic_year_id), 0)
+            attended_sessions = attended_counts.get(sc.course_id, 0)
             
             percentage = (attended_sessions / total_sessions * 100) if total_sessions > 0 else 0
             
@@ -107,41 +143,50 @@ def dashboard(request):
 @login_required
 @role_required(['teacher'])
 def teacher_courses(request):
-    courses = TeacherCourse.objects.filter(teacher=request.user)
+    courses = TeacherCourse.objects.filter(teacher=request.user).select_related(
+        'course__department', 'course__semester__academic_year__batch', 'academic_year__batch'
+    )
     return render(request, 'attendance/teacher_courses.html', {'courses': courses})
 
+ATTENDANCE_STATUSES = frozenset(code for code, _ in Attendance.STATUS_CHOICES)
+
 @login_required
 @role_required(['teacher'])
 def mark_attendance(request, course_id):
     teacher_course = get_object_or_404(TeacherCourse, id=course_id, teacher=request.user)
     
     if request.method == 'POST':
-        # Create new attendance session
-        session = AttendanceSession.objects.create(
-            course=teacher_course.course,
-            teacher=request.user,
-            date=request.POST.get('date'),
-            start_time=request.POST.get('start_time'),
-            end_time=request.POST.get('end_time'),
-            academic_year=teacher_course.academic_year,
-            topic=request.POST.get('topic', '')
-        )
-        
-        # Get all students enrolled in this course
-        students = User.objects.filter(
-            studentcourse__course=teacher_course.course,
-            studentcourse__academic_year=teacher_course.academic_year
-        )
-        
-        # Mark attendance for each student
-        for student in students:
-            status = request.POST.get(f'attendance_{student.id}', 'absent')
-            Attendance.objects.create(
-                session=session,
-                student=student,
-                status=status,
-                marked_by=request.user
+        with transaction.atomic():
+            # Create new attendance session
+            session = AttendanceSession.objects.create(
+                course=teacher_course.course,
+                teacher=request.user,
+                date=request.POST.get('date'),
+                start_time=request.POST.get('start_time'),
+                end_time=request.POST.get('end_time'),
+                academic_year=teacher_course.academic_year,
+                topic=request.POST.get('topic', '')
             )
+            
+            # Get all students enrolled in this course
+            student_ids = User.objects.filter(
+                studentcourse__course=teacher_course.course,
+                studentcourse__academic_year=teacher_course.academic_year
+            ).values_list('id', flat=True)
+            
+            # Mark attendance for every student in a single insert; a missing or
+            # unknown status counts as absent
+            statuses = {student_id: request.POST.get(f'attendance_{student_id}') for student_id in student_ids}
+            Attendance.objects.bulk_create([
+                Attendance(
+                    session=session,
+                    student_id=student_id,
+                    status=status if status in ATTENDANCE_STATUSES else 'absent',
+                    marked_by=request.user
+                )
+                for student_id, status in statuses.items()
+            ], batch_size=500)
+        invalidate_admin_stats()
         
         messages.success(request, 'Attendance marked successfully!')
         return redirect('teacher_courses')
@@ -166,14 +211,12 @@ def attendance_history(request, course_id):
     sessions = AttendanceSession.objects.filter(
         course=teacher_course.course,
         academic_year=teacher_course.academic_year
+    ).annotate(
+        present_count=Count('attendance', filter=Q(attendance__status='present')),
+        absent_count=Count('attendance', filter=Q(attendance__status='absent')),
+        late_count=Count('attendance', filter=Q(attendance__status='late')),
     ).order_by('-date', '-start_time')
 
-    # Annotate attendance counts manually
-    for session in sessions:
-        session.present_count = Attendance.objects.filter(session=session, status='present').count()
-        session.absent_count = Attendance.objects.filter(session=session, status='absent').count()
-        session.late_count = Attendance.objects.filter(session=session, status='late').count()
-
     context = {
         'teacher_course': teacher_course,
         'sessions': sessions,
@@ -181,17 +224,18 @@ def attendance_history(request, course_id):
     return render(request, 'attendance/attendance_history.html', context)
 
 from django.template.loader import render_to_string
-from django.http import HttpResponse, Http404
+from django.http import Http404, HttpResponse
 
 @login_required
 @role_required(['teacher'])
 def session_attendance_detail(request, session_id):
-    try:
-        session = AttendanceSession.objects.get(pk=session_id, teacher=request.user)
-    except AttendanceSession.DoesNotExist:
-        raise Http404("Session not found")
+    session = get_object_or_404(AttendanceSession, pk=session_id, teacher=request.user)
 
-    attendance_records = Attendance.objects.filter(session=session).select_related('student')
+    attendance_records = (
+        Attendance.objects.filter(session=session)
+        .select_related('student')
+        .order_by('student__username')
+    )
 
     html = render_to_string('attendance/partials/session_attendance_detail.html', {
         'session': session,
@@ -204,18 +248,24 @@ def session_attendance_detail(request, session_id):
 @login_required
 @role_required(['student'])
 def student_attendance(request):
-    student_courses = StudentCourse.objects.filter(student=request.user)
+    student_courses = StudentCourse.objects.filter(student=request.user).select_related('course')
+    course_ids = {sc.course_id for sc in student_courses}
+    
+    # Load the student's attendance for all courses at once and group it by course
+    attendances_by_course = {}
+    attendances = Attendance.objects.filter(
+        student=request.user,
+        session__course_id__in=course_ids
+    ).select_related('session', 'marked_by')
+    for attendance in attendances:
+        attendances_by_course.setdefault(attendance.session.course_id, []).append(attendance)
+    
     attendance_data = []
     
     for sc in student_courses:
-        attendances = Attendance.objects.filter(
-            student=request.user,
-            session__course=sc.course
-        ).select_related('session')
-        
         attendance_data.append({
             'course': sc.course,
-            'attendances': attendances
+            'attendances': attendances_by_course.get(sc.course_id, [])
         })
     
     return render(request, 'attendance/student_attendance.html', {'attendance_data': attendance_data})
@@ -223,24 +273,32 @@ def student_attendance(request):
 @login_required
 @role_required(['admin'])
 def admin_reports(request):
+    # The dropdown needs every course anyway, so the selected one is looked up in the same list
+    courses = list(Course.objects.only('id', 'code', 'name').order_by('code'))
+
     if request.method == 'GET' and 'course_id' in request.GET:
         course_id = request.GET.get('course_id')
-        course = get_object_or_404(Course, id=course_id)
+        course = next((c for c in courses if str(c.id) == course_id), None)
+        if course is None:
+            raise Http404("No Course matches the given query.")
         
         # Get attendance report for the course
+        total_sessions = AttendanceSession.objects.filter(course=course).count()
         students = User.objects.filter(
             studentcourse__course=course,
             role='student'
+        ).only('id', 'username', 'first_name', 'last_name', 'student_id').annotate(
+            attended=Count(
+                'attendance',
+                filter=Q(attendance__session__course=course, attendance__status__in=['present', 'late']),
+                distinct=True
+            )
         )
         
         report_data = []
-        for student in students:
-            total_sessions = AttendanceSession.objects.filter(course=course).count()
-            attended_sessions = Attendance.objects.filter(
-                student=student,
-                session__course=course,
-                status__in=['present', 'late']
-            ).count()
+        # Rows go straight into report_data; iterator() skips the queryset's own result cache
+        for student in students.iterator(chunk_size=200):
+            attended_sessions = student.attended
             
             percentage = (attended_sessions / total_sessions * 100) if total_sessions > 0 else 0
             
@@ -254,39 +312,36 @@ def admin_reports(request):
         context = {
             'course': course,
             'report_data': report_data,
-            'courses': Course.objects.all()
+            'courses': courses
         }
         return render(request, 'attendance/admin_reports.html', context)
     
-    courses = Course.objects.all()
     return render(request, 'attendance/admin_reports.html', {'courses': courses})
 
-@login_required
-@role_required(['admin'])
-def create_student(request):
-    if request.method == 'POST':
-        form = StudentCreationForm(request.POST)
-        if form.is_valid():
-            form.save()
-            messages.success(request, "Student created successfully.")
-            return redirect('dashboard')
-    else:
-        form = StudentCreationForm()
-    return render(request, 'attendance/create_student.html', {'form': form})
-
+# Entity slug -> (form class, template, name used in the success message)
+CREATE_FORMS = {
+    'student': (StudentCreationForm, 'attendance/create_student.html', 'Student'),
+    'teacher': (TeacherCreationForm, 'attendance/create_teacher.html', 'Teacher'),
+    'department': (DepartmentForm, 'attendance/create_department.html', 'Department'),
+    'course': (CourseForm, 'attendance/create_course.html', 'Course'),
+    'batch': (BatchForm, 'attendance/create_batch.html', 'Batch'),
+    'program': (ProgramForm, 'attendance/create_program.html', 'Program'),
+    'academic_year': (AcademicYearForm, 'attendance/create_academic_year.html', 'Academic year'),
+    'semester': (SemesterForm, 'attendance/create_semester.html', 'Semester'),
+}
 
 @login_required
 @role_required(['admin'])
-def create_teacher(request):
-    if request.method == 'POST':
-        form = TeacherCreationForm(request.POST)
-        if form.is_valid():
-            form.save()
-            messages.success(request, "Teacher created successfully.")
-            return redirect('dashboard')
-    else:
-        form = TeacherCreationForm()
-    return render(request, 'attendance/create_teacher.html', {'form': form})
+def create_entity(request, entity):
+    # Every create route passes one of the CREATE_FORMS keys
+    Form, template, label = CREATE_FORMS[entity]
+    form = Form(request.POST if request.method == 'POST' else None)
+    if form.is_valid():
+        form.save()
+        invalidate_admin_stats()
+        messages.success(request, f"{label} created successfully.")
+        return redirect('dashboard')
+    return render(request, template, {'form': form})
 
 @login_required
 @role_required(['admin'])
@@ -295,6 +350,7 @@ def assign_teacher_course(request):
         form = AssignTeacherForm(request.POST)
         if form.is_valid():
             form.save()
+            invalidate_admin_stats()
             messages.success(request, 'Teacher assigned to course.')
             return redirect('dashboard')
     else:
@@ -308,74 +364,13 @@ def enroll_student_course(request):
         form = EnrollStudentForm(request.POST)
         if form.is_valid():
             form.save()
+            invalidate_admin_stats()
             messages.success(request, 'Student enrolled in course.')
             return redirect('dashboard')
     else:
         form = EnrollStudentForm()
     return render(request, 'attendance/enroll_student.html', {'form': form})
 
-@login_required
-@role_required(['admin'])
-def create_department(request):
-    form = DepartmentForm(request.POST or None)
-    if form.is_valid():
-        form.save()
-        messages.success(request, "Department created successfully.")
-        return redirect('dashboard')
-    return render(request, 'attendance/create_department.html', {'form': form})
-
-
-@login_required
-@role_required(['admin'])
-def create_course(request):
-    form = CourseForm(request.POST or None)
-    if form.is_valid():
-        form.save()
-        messages.success(request, "Course created successfully.")
-        return redirect('dashboard')
-    return render(request, 'attendance/create_course.html', {'form': form})
-
-
-@login_required
-@role_required(['admin'])
-def create_batch(request):
-    form = BatchForm(request.POST or None)
-    if form.is_valid():
-        form.save()
-        messages.success(request, "Batch created successfully.")
-        return redirect('dashboard')
-    return render(request, 'attendance/create_batch.html', {'form': form})
-
-@login_required
-@role_required(['admin'])
-def create_program(request):
-    form = ProgramForm(request.POST or None)
-    if form.is_valid():
-        form.save()
-        messages.success(request, "Program created successfully.")
-        return redirect('dashboard')
-    return render(request, 'attendance/create_program.html', {'form': form})
-
-@login_required
-@role_required(['admin'])
-def create_academic_year(request):
-    form = AcademicYearForm(request.POST or None)
-    if form.is_valid():
-        form.save()
-        messages.success(request, "Academic year created successfully.")
-        return redirect('dashboard')
-    return render(request, 'attendance/create_academic_year.html', {'form': form})
-
-@login_required
-@role_required(['admin'])
-def create_semester(request):
-    form = SemesterForm(request.POST or None)
-    if form.is_valid():
-        form.save()
-        messages.success(request, "Semester created successfully.")
-        return redirect('dashboard')
-    return render(request, 'attendance/create_semester.html', {'form': form})
-
 from django.http import JsonResponse
 
 
@@ -383,16 +378,19 @@ from django.http import JsonResponse
 @role_required(['admin'])
 def get_students_by_batch(request):
     batch_id = request.GET.get('batch_id')
-    students = User.objects.filter(studentprofile__batch_id=batch_id, role='student')
-    student_data = [{'id': s.id, 'name': s.get_full_name()} for s in students]
+    students = User.objects.filter(
+        studentprofile__batch_id=batch_id, role='student'
+    ).values_list('id', 'first_name', 'last_name')
+    # Same formatting as User.get_full_name(), without building model instances
+    student_data = [{'id': pk, 'name': f"{first} {last}".strip()} for pk, first, last in students]
     return JsonResponse({'students': student_data})
 
 @login_required
 @role_required(['admin'])
 def get_courses_by_semester(request):
     semester_id = request.GET.get('semester_id')
-    courses = Course.objects.filter(semester_id=semester_id)
-    course_data = [{'id': c.id, 'name': f"{c.code} - {c.name}"} for c in courses]
+    courses = Course.objects.filter(semester_id=semester_id).values_list('id', 'code', 'name')
+    course_data = [{'id': pk, 'name': f"{code} - {name}"} for pk, code, name in courses]
     return JsonResponse({'courses': course_data})
 
 @login_required
@@ -423,12 +421,11 @@ def remove_student_course(request):
     if request.method == 'POST':
         student_id = request.POST.get('student_id')
         course_id = request.POST.get('course_id')
-        try:
-            enrollment = StudentCourse.objects.get(student_id=student_id, course_id=course_id)
-            enrollment.delete()
+        deleted, _ = StudentCourse.objects.filter(student_id=student_id, course_id=course_id).delete()
+        if deleted:
+            invalidate_admin_stats()
             return JsonResponse({'success': True, 'message': 'Course removed successfully'})
-        except StudentCourse.DoesNotExist:
-            return JsonResponse({'success': False, 'message': 'Enrollment not found'})
+        return JsonResponse({'success': False, 'message': 'Enrollment not found'})
     return JsonResponse({'success': False, 'message': 'Invalid request'})
 
 @login_required
@@ -437,19 +434,16 @@ def remove_teacher_course(request):
     if request.method == 'POST':
         teacher_id = request.POST.get('teacher_id')
         course_id = request.POST.get('course_id')
-        try:
-            assignment = TeacherCourse.objects.get(teacher_id=teacher_id, course_id=course_id)
-            assignment.delete()
+        deleted, _ = TeacherCourse.objects.filter(teacher_id=teacher_id, course_id=course_id).delete()
+        if deleted:
+            invalidate_admin_stats()
             return JsonResponse({'success': True, 'message': 'Course assignment removed successfully'})
-        except TeacherCourse.DoesNotExist:
-            return JsonResponse({'success': False, 'message': 'Assignment not found'})
+        return JsonResponse({'success': False, 'message': 'Assignment not found'})
     return JsonResponse({'success': False, 'message': 'Invalid request'})
 
 @login_required
 @role_required(['admin'])
 def bulk_enroll_students(request):
-    form = BulkEnrollStudentsForm()
-
     if request.method == 'POST':
         form = BulkEnrollStudentsForm(request.POST)
         if form.is_valid():
@@ -458,15 +452,25 @@ def bulk_enroll_students(request):
             semester = form.cleaned_data['semester']
             academic_year = semester.academic_year
 
-            for student in students:
-                for course in courses:
-                    StudentCourse.objects.get_or_create(
-                        student=student,
-                        course=course,
-                        academic_year=academic_year
-                    )
-            messages.success(request, "Students enrolled successfully.")
+            with transaction.atomic():
+                existing = set(StudentCourse.objects.filter(
+                    student__in=students,
+                    course__in=courses,
+                    academic_year=academic_year
+                ).values_list('student_id', 'course_id'))
+                # Only pairs that are not enrolled yet are sent to the database
+                new_enrollments = [
+                    StudentCourse(student_id=student.id, course_id=course.id, academic_year=academic_year)
+                    for student in students
+                    for course in courses
+                    if (student.id, course.id) not in existing
+                ]
+                StudentCourse.objects.bulk_create(new_enrollments, ignore_conflicts=True, batch_size=1000)
+            invalidate_admin_stats()
+            messages.success(request, f"Students enrolled successfully ({len(new_enrollments)} new enrollments).")
             return redirect('dashboard')
+    else:
+        form = BulkEnrollStudentsForm()
 
     return render(request, 'attendance/bulk_enroll_students.html', {'form': form})
 
@@ -498,12 +502,16 @@ def delete_department(request, pk):
     department = get_object_or_404(Department, pk=pk)
     if request.method == 'POST':
         department.delete()
+        invalidate_admin_stats()
         messages.success(request, "Department deleted.")
         return redirect('department_list')
     return render(request, 'attendance/delete_confirm.html', {'object': department, 'type': 'Department'})
 
 from django.db.models.query import QuerySet
 
+# User columns the student/teacher list pages never display
+USER_LIST_DEFERRED = ('password', 'last_login', 'date_joined')
+
 def list_update_delete(request, model_or_queryset, Form, template, context_name, UpdateForm=None, search_fields=None):
     # Determine if input is a queryset or model
     if isinstance(model_or_queryset, QuerySet):
@@ -516,7 +524,6 @@ def list_update_delete(request, model_or_queryset, Form, template, context_name,
     # Apply search filters
     search_query = request.GET.get('search', '').strip()
     if search_query and search_fields:
-        from django.db.models import Q
         search_filter = Q()
         for field in search_fields:
             search_filter |= Q(**{f"{field}__icontains": search_query})
@@ -574,12 +581,14 @@ def list_update_delete(request, model_or_queryset, Form, template, context_name,
         elif 'delete_id' in request.POST:
             inst = get_object_or_404(Model, pk=request.POST['delete_id'])
             inst.delete()
+            invalidate_admin_stats()
             messages.success(request, f"{Model.__name__} deleted successfully.")
             return redirect(request.path)
         elif 'add' in request.POST:
             form = Form(request.POST)
             if form.is_valid():
                 form.save()
+                invalidate_admin_stats()
                 messages.success(request, f"{Model.__name__} created successfully.")
                 return redirect(request.path)
             else:
@@ -591,14 +600,16 @@ def list_update_delete(request, model_or_queryset, Form, template, context_name,
                 }
                 return render(request, template, context)
 
-    # Prepare filter options for templates
+    # Prepare filter options for templates (POST requests have returned above)
     filter_options = {}
     if Model.__name__ == 'User':
-        filter_options['batches'] = Batch.objects.all()
-        filter_options['courses'] = Course.objects.all()  # Add courses for student/teacher management
+        # Batch.__str__ reads the program and department codes
+        filter_options['batches'] = Batch.objects.select_related('department', 'program')
+        # Add courses for student/teacher management
+        filter_options['courses'] = Course.objects.only('id', 'code', 'name')
     elif Model.__name__ == 'Course':
-        filter_options['departments'] = Department.objects.all()
-        filter_options['semesters'] = Semester.objects.all()
+        filter_options['departments'] = Department.objects.only('id', 'name')
+        filter_options['semesters'] = Semester.objects.select_related('academic_year__batch')
 
     context = {
         context_name: page,
@@ -636,20 +647,24 @@ def semester_list(request):
 @login_required
 @role_required(['admin'])
 def course_list(request):
-    return list_update_delete(request, Course, CourseForm, 'attendance/course_list.html', 'courses',
+    # Rows show the department name and the semester, whose __str__ walks up to the batch
+    queryset = Course.objects.select_related('department', 'semester__academic_year__batch')
+    return list_update_delete(request, queryset, CourseForm, 'attendance/course_list.html', 'courses',
                             search_fields=['name', 'code', 'department__name'])
 
 @login_required
 @role_required(['admin'])
 def student_list(request):
-    queryset = User.objects.filter(role='student')
+    queryset = User.objects.filter(role='student').defer(*USER_LIST_DEFERRED).select_related(
+        'studentprofile__batch__department', 'studentprofile__batch__program'
+    )
     return list_update_delete(request, queryset, StudentCreationForm, 'attendance/student_list.html', 'students', 
                             StudentUpdateForm, search_fields=['username', 'first_name', 'last_name', 'email', 'student_id'])
 
 @login_required
 @role_required(['admin'])
 def teacher_list(request):
-    queryset = User.objects.filter(role='teacher')
+    queryset = User.objects.filter(role='teacher').defer(*USER_LIST_DEFERRED)
     return list_update_delete(request, queryset, TeacherCreationForm, 'attendance/teacher_list.html', 'teachers', 
                             TeacherUpdateForm, search_fields=['username', 'first_name', 'last_name', 'email', 'employee_id'])
 
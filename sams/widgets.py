@@ -1,144 +1,124 @@
 from django import forms
+from django.forms.utils import flatatt
 from django.forms.widgets import CheckboxSelectMultiple
-from django.utils.html import format_html
+from django.utils.html import conditional_escape, escape
 from django.utils.safestring import mark_safe
 
+# The look shared by the styled widgets lives in the .sams-input rule in base.html
+_INPUT_CLASS_ATTRS = {'class': 'form-control sams-input'}
 
-class CustomCheckboxSelectMultiple(CheckboxSelectMultiple):
+
+# Rendered while a dependent list is still empty, e.g. before the AJAX load fills it
+_EMPTY_CHECKBOX_GROUP = mark_safe('<div class="checkbox-group">\n</div>')
+
+
+def _checkbox_attrs(value_html, checkbox_id, checked):
+    """Attributes that differ per checkbox, in the form flatatt() would produce"""
+    return f' value="{value_html}" id="{checkbox_id}"' + (' checked' if checked else '')
+
+
+class _StyledWidgetMixin:
+    """Merges the class-level default attrs with the attrs passed to the widget"""
+
+    _DEFAULT_ATTRS = {}
+
+    def __init__(self, attrs=None, **kwargs):
+        super().__init__(attrs={**self._DEFAULT_ATTRS, **attrs} if attrs else dict(self._DEFAULT_ATTRS), **kwargs)
+
+
+class CustomCheckboxSelectMultiple(_StyledWidgetMixin, CheckboxSelectMultiple):
     """Custom checkbox widget with better styling"""
     
-    def __init__(self, attrs=None):
-        default_attrs = {'class': 'form-check-input'}
-        if attrs:
-            default_attrs.update(attrs)
-        super().__init__(attrs=default_attrs)
-    
+    _DEFAULT_ATTRS = {'class': 'form-check-input'}
+
+    @property
+    def choices(self):
+        return self._choices
+
+    @choices.setter
+    def choices(self, value):
+        self._choices = value
+        self._choices_cache = None
+
+    def _get_choices(self):
+        # A ModelChoiceIterator queries the database each time it is iterated, so
+        # a form that is shown again (e.g. with errors) reuses the first result.
+        # Values are stored as strings (for the checked test) and escaped for the
+        # value attribute, and labels escaped, which also resolves lazy strings once.
+        if self._choices_cache is None:
+            self._choices_cache = tuple(
+                (str(option_value), escape(option_value), conditional_escape(option_label))
+                for option_value, option_label in self._choices
+            )
+        return self._choices_cache
+
     def render(self, name, value, attrs=None, renderer=None):
-        if value is None:
-            value = []
-        
-        output = []
-        output.append('<div class="checkbox-group">')
-        
-        for i, (option_value, option_label) in enumerate(self.choices):
-            checkbox_attrs = self.build_attrs(attrs, {'type': 'checkbox', 'name': name, 'value': option_value})
-            if option_value in value:
-                checkbox_attrs['checked'] = True
-            
-            checkbox_id = f"{name}_{i}"
-            checkbox_attrs['id'] = checkbox_id
-            
-            output.append(format_html(
-                '<div class="form-check mb-2">'
-                '<input{} />'
-                '<label class="form-check-label" for="{}">{}</label>'
-                '</div>',
-                forms.widgets.flatatt(checkbox_attrs),
-                checkbox_id,
-                option_label
-            ))
-        
-        output.append('</div>')
-        return mark_safe('\n'.join(output))
-
-
-class CustomRadioSelect(forms.RadioSelect):
+        choices = self._get_choices()
+        if not choices:
+            return _EMPTY_CHECKBOX_GROUP
+
+        # Compared as strings, like Django's own choice widgets, so model
+        # choice values (which are not strings) can match the submitted data
+        value_set = frozenset(str(v) for v in value or ())
+        # Attributes shared by every checkbox are flattened once; each row only adds value, id and checked.
+        # The form's own id for the field is replaced by the per-row ids.
+        shared_attrs = self.build_attrs(self.attrs, {**(attrs or {}), 'type': 'checkbox', 'name': name})
+        shared_attrs.pop('id', None)
+        shared_attrs = flatatt(shared_attrs)
+
+        def rows():
+            for i, (value_str, value_html, label_html) in enumerate(choices):
+                checkbox_id = f"{name}_{i}"
+                row_attrs = _checkbox_attrs(value_html, checkbox_id, value_str in value_set)
+                # The id is built from the field name and a counter, and the label was escaped in _get_choices()
+                yield (
+                    f'<div class="form-check mb-2">'
+                    f'<input{shared_attrs}{row_attrs} />'
+                    f'<label class="form-check-label" for="{checkbox_id}">{label_html}</label>'
+                    f'</div>'
+                )
+
+        # One join over the wrapper and the rows builds the final string in a single pass
+        return mark_safe('\n'.join(['<div class="checkbox-group">', *rows(), '</div>']))
+
+
+class CustomRadioSelect(_StyledWidgetMixin, forms.RadioSelect):
     """Custom radio button widget with better styling"""
     
-    def __init__(self, attrs=None):
-        default_attrs = {'class': 'form-check-input'}
-        if attrs:
-            default_attrs.update(attrs)
-        super().__init__(attrs=default_attrs)
+    _DEFAULT_ATTRS = {'class': 'form-check-input'}
 
 
-class StyledSelect(forms.Select):
+class StyledSelect(_StyledWidgetMixin, forms.Select):
     """Custom select widget with better styling"""
     
-    def __init__(self, attrs=None):
-        default_attrs = {
-            'class': 'form-select',
-            'style': 'border-radius: 8px; border: 2px solid #e9ecef; padding: 10px 15px;'
-        }
-        if attrs:
-            default_attrs.update(attrs)
-        super().__init__(attrs=default_attrs)
+    _DEFAULT_ATTRS = {'class': 'form-select sams-input'}
 
 
-class SearchableSelect(forms.Select):
+class SearchableSelect(StyledSelect):
     """Select widget with search functionality"""
     
-    def __init__(self, attrs=None):
-        default_attrs = {
-            'class': 'form-select searchable-select',
-            'style': 'border-radius: 8px; border: 2px solid #e9ecef; padding: 10px 15px;'
-        }
-        if attrs:
-            default_attrs.update(attrs)
-        super().__init__(attrs=default_attrs)
+    _DEFAULT_ATTRS = {'class': 'form-select searchable-select sams-input'}
 
 
-class StyledTextInput(forms.TextInput):
+class StyledTextInput(_StyledWidgetMixin, forms.TextInput):
     """Custom text input widget with better styling"""
     
-    def __init__(self, attrs=None):
-        default_attrs = {
-            'class': 'form-control',
-            'style': 'border-radius: 8px; border: 2px solid #e9ecef; padding: 10px 15px;'
-        }
-        if attrs:
-            default_attrs.update(attrs)
-        super().__init__(attrs=default_attrs)
+    _DEFAULT_ATTRS = _INPUT_CLASS_ATTRS
 
 
-class StyledEmailInput(forms.EmailInput):
+class StyledEmailInput(_StyledWidgetMixin, forms.EmailInput):
     """Custom email input widget with better styling"""
     
-    def __init__(self, attrs=None):
-        default_attrs = {
-            'class': 'form-control',
-            'style': 'border-radius: 8px; border: 2px solid #e9ecef; padding: 10px 15px;'
-        }
-        if attrs:
-            default_attrs.update(attrs)
-        super().__init__(attrs=default_attrs)
+    _DEFAULT_ATTRS = _INPUT_CLASS_ATTRS
 
 
-class StyledNumberInput(forms.NumberInput):
+class StyledNumberInput(_StyledWidgetMixin, forms.NumberInput):
     """Custom number input widget with better styling"""
     
-    def __init__(self, attrs=None):
-        default_attrs = {
-            'class': 'form-control',
-            'style': 'border-radius: 8px; border: 2px solid #e9ecef; padding: 10px 15px;'
-        }
-        if attrs:
-            default_attrs.update(attrs)
-        super().__init__(attrs=default_attrs)
+    _DEFAULT_ATTRS = _INPUT_CLASS_ATTRS
 
 
-class StyledTextarea(forms.Textarea):
+class StyledTextarea(_StyledWidgetMixin, forms.Textarea):
     """Custom textarea widget with better styling"""
     
-    def __init__(self, attrs=None):
-        default_attrs = {
-            'class': 'form-control',
-            'style': 'border-radius: 8px; border: 2px solid #e9ecef; padding: 10px 15px;',
-            'rows': 4
-        }
-        if attrs:
-            default_attrs.update(attrs)
-        super().__init__(attrs=default_attrs)
-
-
-class SearchableSelect(forms.Select):
-    """Select widget with search functionality (same as StyledSelect for now)"""
-    
-    def __init__(self, attrs=None):
-        default_attrs = {
-            'class': 'form-select',
-            'style': 'border-radius: 8px; border: 2px solid #e9ecef; padding: 10px 15px;'
-        }
-        if attrs:
-            default_attrs.update(attrs)
-        super().__init__(attrs=default_attrs)
\ No newline at end of file
+    _DEFAULT_ATTRS = {**_INPUT_CLASS_ATTRS, 'rows': 4}
@@ -1,52 +1,63 @@
 from django.test import TestCase
 from django.contrib.auth import get_user_model
-from django.db import IntegrityError
+from django.core.exceptions import NON_FIELD_ERRORS
+from django.db import IntegrityError, transaction
 from sams.forms import *
 from sams.models import *
+from academic_fixtures import AcademicFixtureTestCase
 
 User = get_user_model()
 
+STUDENT_KW = {'password': 'password123', 'role': 'student'}
+TEACHER_KW = {'password': 'password123', 'role': 'teacher'}
+
+# Form classes used by the mixin tests, built once at import rather than in every test
+class DedupDepartmentForm(DeduplicationMixin, forms.ModelForm):
+    class Meta:
+        model = Department
+        fields = ['name', 'code']
+
+class BootstrapTestForm(BootstrapFormMixin, forms.Form):
+    text_field = forms.CharField()
+    email_field = forms.EmailField()
+    number_field = forms.IntegerField()
+    select_field = forms.ChoiceField(choices=[('1', 'One'), ('2', 'Two')])
+    multi_select_field = forms.MultipleChoiceField(choices=[('1', 'One'), ('2', 'Two')])
+
+class BootstrapExistingClassForm(BootstrapFormMixin, forms.Form):
+    text_field = forms.CharField(widget=forms.TextInput(attrs={'class': 'existing-class'}))
+
 class DeduplicationMixinTest(TestCase):
     def test_deduplication_mixin_save(self):
         """Test that DeduplicationMixin handles IntegrityError correctly"""
-        # Create a form with DeduplicationMixin
-        class TestForm(DeduplicationMixin, forms.ModelForm):
-            class Meta:
-                model = Department
-                fields = ['name', 'code']
-        
         # Create a department
         Department.objects.create(name='Computer Science', code='CS')
         
         # Try to create another department with the same code
-        form = TestForm({
+        form = DedupDepartmentForm({
             'name': 'Computer Engineering',
             'code': 'CS'  # Duplicate code
         })
         
         self.assertTrue(form.is_valid())
         
-        # Should raise IntegrityError and add form error
+        # Should raise IntegrityError and add form error. The savepoint keeps the
+        # failed INSERT from breaking the transaction TestCase wraps around the test.
         with self.assertRaises(IntegrityError):
-            form.save()
+            with transaction.atomic():
+                form.save()
         
-        self.assertIn('Duplicate entry already exists.', form.non_field_errors())
+        self.assertTrue(form.has_error(NON_FIELD_ERRORS, code='duplicate'))
         
     def test_deduplication_mixin_save_no_error(self):
         """Test that DeduplicationMixin works correctly when no error occurs"""
-        # Create a form with DeduplicationMixin
-        class TestForm(DeduplicationMixin, forms.ModelForm):
-            class Meta:
-                model = Department
-                fields = ['name', 'code']
-        
         # Create a department with unique code
-        form = TestForm({
+        form = DedupDepartmentForm({
             'name': 'Computer Science',
             'code': 'CS1'  # Unique code
         })
         
-        self.assertTrue(form.is_valid())
+        self.assertEqual(form.errors, {})
         department = form.save()
         
         # Verify department was created
@@ -57,14 +68,7 @@ class DeduplicationMixinTest(TestCase):
 class BootstrapFormMixinTest(TestCase):
     def test_bootstrap_form_mixin(self):
         """Test that BootstrapFormMixin adds Bootstrap classes to form fields"""
-        class TestForm(BootstrapFormMixin, forms.Form):
-            text_field = forms.CharField()
-            email_field = forms.EmailField()
-            number_field = forms.IntegerField()
-            select_field = forms.ChoiceField(choices=[('1', 'One'), ('2', 'Two')])
-            multi_select_field = forms.MultipleChoiceField(choices=[('1', 'One'), ('2', 'Two')])
-        
-        form = TestForm()
+        form = BootstrapTestForm()
         
         # Check that form fields have Bootstrap classes
         self.assertIn('form-control', form.fields['text_field'].widget.attrs['class'])
@@ -75,61 +79,52 @@ class BootstrapFormMixinTest(TestCase):
         
     def test_bootstrap_form_mixin_with_existing_classes(self):
         """Test that BootstrapFormMixin preserves existing classes"""
-        class TestForm(BootstrapFormMixin, forms.Form):
-            text_field = forms.CharField(widget=forms.TextInput(attrs={'class': 'existing-class'}))
-        
-        form = TestForm()
+        form = BootstrapExistingClassForm()
         
         # Check that form field has both existing and Bootstrap classes
         self.assertIn('existing-class', form.fields['text_field'].widget.attrs['class'])
         self.assertIn('form-control', form.fields['text_field'].widget.attrs['class'])
 
 class StudentCreationFormTest(TestCase):
-    def setUp(self):
-        self.department = Department.objects.create(
+    BASE_FORM_DATA = {
+        'username': 'newstudent',
+        'password1': 'complex_password123',
+        'password2': 'complex_password123',
+        'first_name': 'New',
+        'last_name': 'Student',
+        'email': 'newstudent@example.com',
+        'student_id': 'S12345',
+        'phone': '1234567890',
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.department = Department.objects.create(
             name='Computer Science',
             code='CS'
         )
-        self.program = Program.objects.create(
+        cls.program = Program.objects.create(
             name='Bachelor of Technology',
             code='BTech'
         )
-        self.batch = Batch.objects.create(
+        cls.batch = Batch.objects.create(
             year='2023-2025',
-            department=self.department,
-            program=self.program
+            department=cls.department,
+            program=cls.program
         )
 
     def test_student_creation_form_valid(self):
-        form_data = {
-            'username': 'newstudent',
-            'password1': 'complex_password123',
-            'password2': 'complex_password123',
-            'first_name': 'New',
-            'last_name': 'Student',
-            'email': 'newstudent@example.com',
-            'student_id': 'S12345',
-            'phone': '1234567890',
-            'batch': self.batch.id
-        }
-        form = StudentCreationForm(data=form_data)
+        form = StudentCreationForm(data={**self.BASE_FORM_DATA, 'batch': self.batch.id})
         self.assertTrue(form.is_valid())
 
     def test_student_creation_form_password_mismatch(self):
-        form_data = {
-            'username': 'newstudent',
-            'password1': 'complex_password123',
+        form = StudentCreationForm(data={
+            **self.BASE_FORM_DATA,
             'password2': 'different_password',
-            'first_name': 'New',
-            'last_name': 'Student',
-            'email': 'newstudent@example.com',
-            'student_id': 'S12345',
-            'phone': '1234567890',
-            'batch': self.batch.id
-        }
-        form = StudentCreationForm(data=form_data)
+            'batch': self.batch.id,
+        })
         self.assertFalse(form.is_valid())
-        self.assertIn('Passwords do not match.', form.non_field_errors())
+        self.assertFormError(form, None, 'Passwords do not match.')
 
     def test_student_creation_form_missing_required_fields(self):
         form_data = {
@@ -141,19 +136,8 @@ class StudentCreationFormTest(TestCase):
         self.assertFalse(form.is_valid())
 
     def test_student_creation_form_save(self):
-        form_data = {
-            'username': 'newstudent',
-            'password1': 'complex_password123',
-            'password2': 'complex_password123',
-            'first_name': 'New',
-            'last_name': 'Student',
-            'email': 'newstudent@example.com',
-            'student_id': 'S12345',
-            'phone': '1234567890',
-            'batch': self.batch.id
-        }
-        form = StudentCreationForm(data=form_data)
-        self.assertTrue(form.is_valid())
+        form = StudentCreationForm(data={**self.BASE_FORM_DATA, 'batch': self.batch.id})
+        self.assertEqual(form.errors, {})
         
         user = form.save()
         self.assertEqual(user.role, 'student')
@@ -162,47 +146,29 @@ class StudentCreationFormTest(TestCase):
         self.assertEqual(user.studentprofile.batch, self.batch)
 
 class TeacherCreationFormTest(TestCase):
+    BASE_FORM_DATA = {
+        'username': 'newteacher',
+        'password1': 'complex_password123',
+        'password2': 'complex_password123',
+        'first_name': 'New',
+        'last_name': 'Teacher',
+        'email': 'newteacher@example.com',
+        'employee_id': 'T12345',
+        'phone': '1234567890',
+    }
+
     def test_teacher_creation_form_valid(self):
-        form_data = {
-            'username': 'newteacher',
-            'password1': 'complex_password123',
-            'password2': 'complex_password123',
-            'first_name': 'New',
-            'last_name': 'Teacher',
-            'email': 'newteacher@example.com',
-            'employee_id': 'T12345',
-            'phone': '1234567890'
-        }
-        form = TeacherCreationForm(data=form_data)
+        form = TeacherCreationForm(data=self.BASE_FORM_DATA)
         self.assertTrue(form.is_valid())
 
     def test_teacher_creation_form_password_mismatch(self):
-        form_data = {
-            'username': 'newteacher',
-            'password1': 'complex_password123',
-            'password2': 'different_password',
-            'first_name': 'New',
-            'last_name': 'Teacher',
-            'email': 'newteacher@example.com',
-            'employee_id': 'T12345',
-            'phone': '1234567890'
-        }
-        form = TeacherCreationForm(data=form_data)
+        form = TeacherCreationForm(data={**self.BASE_FORM_DATA, 'password2': 'different_password'})
         self.assertFalse(form.is_valid())
+        self.assertFormError(form, None, 'Passwords do not match.')
 
     def test_teacher_creation_form_save(self):
-        form_data = {
-            'username': 'newteacher',
-            'password1': 'complex_password123',
-            'password2': 'complex_password123',
-            'first_name': 'New',
-            'last_name': 'Teacher',
-            'email': 'newteacher@example.com',
-            'employee_id': 'T12345',
-            'phone': '1234567890'
-        }
-        form = TeacherCreationForm(data=form_data)
-        self.assertTrue(form.is_valid())
+        form = TeacherCreationForm(data=self.BASE_FORM_DATA)
+        self.assertEqual(form.errors, {})
         
         user = form.save()
         self.assertEqual(user.role, 'teacher')
@@ -241,12 +207,13 @@ class ProgramFormTest(TestCase):
         self.assertFalse(form.is_valid())
 
 class BatchFormTest(TestCase):
-    def setUp(self):
-        self.department = Department.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.department = Department.objects.create(
             name='Computer Science',
             code='CS'
         )
-        self.program = Program.objects.create(
+        cls.program = Program.objects.create(
             name='Bachelor of Technology',
             code='BTech'
         )
@@ -268,19 +235,20 @@ class BatchFormTest(TestCase):
         self.assertFalse(form.is_valid())
 
 class AcademicYearFormTest(TestCase):
-    def setUp(self):
-        self.department = Department.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.department = Department.objects.create(
             name='Computer Science',
             code='CS'
         )
-        self.program = Program.objects.create(
+        cls.program = Program.objects.create(
             name='Bachelor of Technology',
             code='BTech'
         )
-        self.batch = Batch.objects.create(
+        cls.batch = Batch.objects.create(
             year='2023-2025',
-            department=self.department,
-            program=self.program
+            department=cls.department,
+            program=cls.program
         )
 
     def test_academic_year_form_valid(self):
@@ -300,22 +268,23 @@ class AcademicYearFormTest(TestCase):
         self.assertFalse(form.is_valid())
 
 class SemesterFormTest(TestCase):
-    def setUp(self):
-        self.department = Department.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.department = Department.objects.create(
             name='Computer Science',
             code='CS'
         )
-        self.program = Program.objects.create(
+        cls.program = Program.objects.create(
             name='Bachelor of Technology',
             code='BTech'
         )
-        self.batch = Batch.objects.create(
+        cls.batch = Batch.objects.create(
             year='2023-2025',
-            department=self.department,
-            program=self.program
+            department=cls.department,
+            program=cls.program
         )
-        self.academic_year = AcademicYear.objects.create(
-            batch=self.batch,
+        cls.academic_year = AcademicYear.objects.create(
+            batch=cls.batch,
             start_year=2023,
             end_year=2024
         )
@@ -337,27 +306,28 @@ class SemesterFormTest(TestCase):
         self.assertFalse(form.is_valid())
 
 class CourseFormTest(TestCase):
-    def setUp(self):
-        self.department = Department.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.department = Department.objects.create(
             name='Computer Science',
             code='CS'
         )
-        self.program = Program.objects.create(
+        cls.program = Program.objects.create(
             name='Bachelor of Technology',
             code='BTech'
         )
-        self.batch = Batch.objects.create(
+        cls.batch = Batch.objects.create(
             year='2023-2025',
-            department=self.department,
-            program=self.program
+            department=cls.department,
+            program=cls.program
         )
-        self.academic_year = AcademicYear.objects.create(
-            batch=self.batch,
+        cls.academic_year = AcademicYear.objects.create(
+            batch=cls.batch,
             start_year=2023,
             end_year=2024
         )
-        self.semester = Semester.objects.create(
-            academic_year=self.academic_year,
+        cls.semester = Semester.objects.create(
+            academic_year=cls.academic_year,
             number=1,
             name='First Semester'
         )
@@ -381,42 +351,13 @@ class CourseFormTest(TestCase):
         form = CourseForm(data=form_data)
         self.assertFalse(form.is_valid())
 
-class AssignTeacherFormTest(TestCase):
-    def setUp(self):
-        self.department = Department.objects.create(
-            name='Computer Science',
-            code='CS'
-        )
-        self.program = Program.objects.create(
-            name='Bachelor of Technology',
-            code='BTech'
-        )
-        self.batch = Batch.objects.create(
-            year='2023-2025',
-            department=self.department,
-            program=self.program
-        )
-        self.academic_year = AcademicYear.objects.create(
-            batch=self.batch,
-            start_year=2023,
-            end_year=2024
-        )
-        self.semester = Semester.objects.create(
-            academic_year=self.academic_year,
-            number=1,
-            name='First Semester'
-        )
-        self.course = Course.objects.create(
-            name='Introduction to Programming',
-            code='CS101',
-            credits=4,
-            department=self.department,
-            semester=self.semester
-        )
-        self.teacher = User.objects.create_user(
+class AssignTeacherFormTest(AcademicFixtureTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.teacher = User.objects.create_user(
             username='teacher1',
-            password='password123',
-            role='teacher'
+            **TEACHER_KW
         )
 
     def test_assign_teacher_form_valid(self):
@@ -436,42 +377,17 @@ class AssignTeacherFormTest(TestCase):
         form = AssignTeacherForm(data=form_data)
         self.assertFalse(form.is_valid())
 
-class EnrollStudentFormTest(TestCase):
-    def setUp(self):
-        self.department = Department.objects.create(
-            name='Computer Science',
-            code='CS'
-        )
-        self.program = Program.objects.create(
-            name='Bachelor of Technology',
-            code='BTech'
-        )
-        self.batch = Batch.objects.create(
-            year='2023-2025',
-            department=self.department,
-            program=self.program
-        )
-        self.academic_year = AcademicYear.objects.create(
-            batch=self.batch,
-            start_year=2023,
-            end_year=2024
-        )
-        self.semester = Semester.objects.create(
-            academic_year=self.academic_year,
-            number=1,
-            name='First Semester'
-        )
-        self.course = Course.objects.create(
-            name='Introduction to Programming',
-            code='CS101',
-            credits=4,
-            department=self.department,
-            semester=self.semester
-        )
-        self.student = User.objects.create_user(
+class EnrollStudentFormTest(AcademicFixtureTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.student = User.objects.create_user(
             username='student1',
-            password='password123',
-            role='student'
+            **STUDENT_KW
+        )
+        cls.teacher = User.objects.create_user(
+            username='teacher1',
+            **TEACHER_KW
         )
 
     def test_enroll_student_form_valid(self):
@@ -493,56 +409,20 @@ class EnrollStudentFormTest(TestCase):
         
     def test_enroll_student_form_queryset_filter(self):
         """Test that student queryset is filtered to only include students"""
-        # Create a teacher user
-        teacher = User.objects.create_user(
-            username='teacher1',
-            password='password123',
-            role='teacher'
-        )
-        
         form = EnrollStudentForm()
         
         # Check that only students are in the queryset
-        student_ids = list(form.fields['student'].queryset.values_list('id', flat=True))
-        self.assertIn(self.student.id, student_ids)
-        self.assertNotIn(teacher.id, student_ids)
-
-class BulkEnrollStudentsFormTest(TestCase):
-    def setUp(self):
-        self.department = Department.objects.create(
-            name='Computer Science',
-            code='CS'
-        )
-        self.program = Program.objects.create(
-            name='Bachelor of Technology',
-            code='BTech'
-        )
-        self.batch = Batch.objects.create(
-            year='2023-2025',
-            department=self.department,
-            program=self.program
-        )
-        self.academic_year = AcademicYear.objects.create(
-            batch=self.batch,
-            start_year=2023,
-            end_year=2024
-        )
-        self.semester = Semester.objects.create(
-            academic_year=self.academic_year,
-            number=1,
-            name='First Semester'
-        )
-        self.course = Course.objects.create(
-            name='Introduction to Programming',
-            code='CS101',
-            credits=4,
-            department=self.department,
-            semester=self.semester
-        )
-        self.student = User.objects.create_user(
+        queryset = form.fields['student'].queryset
+        self.assertTrue(queryset.filter(pk=self.student.pk).exists())
+        self.assertFalse(queryset.filter(pk=self.teacher.pk).exists())
+
+class BulkEnrollStudentsFormTest(AcademicFixtureTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.student = User.objects.create_user(
             username='student1',
-            password='password123',
-            role='student'
+            **STUDENT_KW
         )
 
     def test_bulk_enroll_students_form_valid(self):
@@ -575,28 +455,28 @@ class BulkEnrollStudentsFormTest(TestCase):
         self.assertIsInstance(form.fields['courses'].widget, CustomCheckboxSelectMultiple)
 
 class StudentUpdateFormTest(TestCase):
-    def setUp(self):
-        self.department = Department.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.department = Department.objects.create(
             name='Computer Science',
             code='CS'
         )
-        self.program = Program.objects.create(
+        cls.program = Program.objects.create(
             name='Bachelor of Technology',
             code='BTech'
         )
-        self.batch = Batch.objects.create(
+        cls.batch = Batch.objects.create(
             year='2023-2025',
-            department=self.department,
-            program=self.program
+            department=cls.department,
+            program=cls.program
         )
-        self.student = User.objects.create_user(
+        cls.student = User.objects.create_user(
             username='student1',
-            password='password123',
-            role='student'
+            **STUDENT_KW
         )
-        self.student_profile = StudentProfile.objects.create(
-            user=self.student,
-            batch=self.batch
+        cls.student_profile = StudentProfile.objects.create(
+            user=cls.student,
+            batch=cls.batch
         )
 
     def test_student_update_form_valid(self):
@@ -635,7 +515,7 @@ class StudentUpdateFormTest(TestCase):
         }
         
         form = StudentUpdateForm(data=form_data, instance=self.student)
-        self.assertTrue(form.is_valid())
+        self.assertEqual(form.errors, {})
         
         # Save the form
         user = form.save()
@@ -651,8 +531,7 @@ class StudentUpdateFormTest(TestCase):
         # Create student without profile
         student_no_profile = User.objects.create_user(
             username='student2',
-            password='password123',
-            role='student'
+            **STUDENT_KW
         )
         
         form_data = {
@@ -666,7 +545,7 @@ class StudentUpdateFormTest(TestCase):
         }
         
         form = StudentUpdateForm(data=form_data, instance=student_no_profile)
-        self.assertTrue(form.is_valid())
+        self.assertEqual(form.errors, {})
         
         # Save the form
         user = form.save()
@@ -679,11 +558,11 @@ class StudentUpdateFormTest(TestCase):
         self.assertEqual(user.studentprofile.batch, self.batch)
 
 class TeacherUpdateFormTest(TestCase):
-    def setUp(self):
-        self.teacher = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = User.objects.create_user(
             username='teacher1',
-            password='password123',
-            role='teacher'
+            **TEACHER_KW
         )
 
     def test_teacher_update_form_valid(self):
@@ -698,47 +577,18 @@ class TeacherUpdateFormTest(TestCase):
         form = TeacherUpdateForm(data=form_data, instance=self.teacher)
         self.assertTrue(form.is_valid())
 
-class TeacherCourseUpdateFormTest(TestCase):
-    def setUp(self):
-        self.department = Department.objects.create(
-            name='Computer Science',
-            code='CS'
-        )
-        self.program = Program.objects.create(
-            name='Bachelor of Technology',
-            code='BTech'
-        )
-        self.batch = Batch.objects.create(
-            year='2023-2025',
-            department=self.department,
-            program=self.program
-        )
-        self.academic_year = AcademicYear.objects.create(
-            batch=self.batch,
-            start_year=2023,
-            end_year=2024
-        )
-        self.semester = Semester.objects.create(
-            academic_year=self.academic_year,
-            number=1,
-            name='First Semester'
-        )
-        self.course = Course.objects.create(
-            name='Introduction to Programming',
-            code='CS101',
-            credits=4,
-            department=self.department,
-            semester=self.semester
-        )
-        self.teacher = User.objects.create_user(
+class TeacherCourseUpdateFormTest(AcademicFixtureTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.teacher = User.objects.create_user(
             username='teacher1',
-            password='password123',
-            role='teacher'
+            **TEACHER_KW
         )
-        self.teacher_course = TeacherCourse.objects.create(
-            teacher=self.teacher,
-            course=self.course,
-            academic_year=self.academic_year
+        cls.teacher_course = TeacherCourse.objects.create(
+            teacher=cls.teacher,
+            course=cls.course,
+            academic_year=cls.academic_year
         )
 
     def test_teacher_course_update_form_valid(self):
@@ -754,12 +604,11 @@ class TeacherCourseUpdateFormTest(TestCase):
         # Create a student user to test filtering
         student = User.objects.create_user(
             username='student1',
-            password='password123',
-            role='student'
+            **STUDENT_KW
         )
         
         form = TeacherCourseUpdateForm()
         # Should only include teachers, not students
-        teacher_ids = list(form.fields['teacher'].queryset.values_list('id', flat=True))
-        self.assertIn(self.teacher.id, teacher_ids)
-        self.assertNotIn(student.id, teacher_ids)
\ No newline at end of file
+        queryset = form.fields['teacher'].queryset
+        self.assertTrue(queryset.filter(pk=self.teacher.pk).exists())
+        self.assertFalse(queryset.filter(pk=student.pk).exists())
\ No newline at end of file
@@ -1,4 +1,5 @@
-from django.test import TestCase, Client
+from django.test import TestCase, Client, override_settings
+from django.core.cache import cache
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 from django.utils import timezone
@@ -171,6 +172,28 @@ class AdminViewsTest(TestCase):
         self.assertEqual(response.status_code, 302)  # Redirect after success
         self.assertTrue(StudentCourse.objects.filter(student=student, course=self.course).exists())
 
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_dashboard_stats_refresh_after_enrollment(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        student = User.objects.create_user(
+            username='student1',
+            password='password123',
+            role='student'
+        )
+        response = self.client.get(reverse('dashboard'))
+        self.assertEqual(response.context['total_enrollments'], 0)
+
+        form_data = {
+            'student': student.id,
+            'course': self.course.id,
+            'academic_year': self.academic_year.id
+        }
+        self.client.post(reverse('enroll_student_course'), data=form_data)
+        # The cached counts are dropped by the write, not left to expire
+        response = self.client.get(reverse('dashboard'))
+        self.assertEqual(response.context['total_enrollments'], 1)
+
     def test_admin_reports_view(self):
         response = self.client.get(reverse('admin_reports'))
         self.assertEqual(response.status_code, 200)
@@ -276,6 +299,29 @@ class TeacherViewsTest(TestCase):
         # Check if attendance was marked
         self.assertTrue(Attendance.objects.filter(student=student, status='present').exists())
 
+    def test_mark_attendance_view_post_invalid_status(self):
+        student = User.objects.create_user(
+            username='student1',
+            password='password123',
+            role='student'
+        )
+        StudentCourse.objects.create(
+            student=student,
+            course=self.course,
+            academic_year=self.academic_year
+        )
+        
+        form_data = {
+            'date': timezone.now().date(),
+            'start_time': '09:00',
+            'end_time': '10:00',
+            f'attendance_{student.id}': 'foo'
+        }
+        response = self.client.post(reverse('mark_attendance', args=[self.teacher_course.id]), data=form_data)
+        self.assertEqual(response.status_code, 302)
+        # An unknown status is recorded as absent instead of failing the request
+        self.assertEqual(Attendance.objects.get(student=student).status, 'absent')
+
     def test_attendance_history_view(self):
         response = self.client.get(reverse('attendance_history', args=[self.teacher_course.id]))
         self.assertEqual(response.status_code, 200)
@@ -31,6 +31,25 @@ class WidgetTestCase(TestCase):
         html = widget.render('test', None)
         self.assertIn('data-test="value"', html)
     
+    def test_custom_checkbox_select_multiple_render_attrs_and_escaping(self):
+        """Rendering keeps the widget's class, escapes choices and marks the selected boxes"""
+        choices = [(1, 'Plain'), ('a"b', '<b>Bold</b>')]
+        widget = CustomCheckboxSelectMultiple(choices=choices)
+        
+        html = widget.render('test', [1], attrs=None)
+        self.assertEqual(html.count('class="form-check-input"'), 2)
+        self.assertIn('value="1" id="test_0" checked', html)
+        self.assertNotIn('id="test_1" checked', html)
+        self.assertIn('value="a&quot;b"', html)
+        self.assertIn('&lt;b&gt;Bold&lt;/b&gt;', html)
+        self.assertNotIn('<b>', html)
+        
+        # Attrs passed at render time are added to the widget's own attrs
+        html = widget.render('test', None, attrs={'id': 'id_test', 'data-test': 'value'})
+        self.assertIn('class="form-check-input"', html)
+        self.assertIn('data-test="value"', html)
+        self.assertNotIn('id="id_test"', html)
+    
     def test_custom_radio_select(self):
         """Test the CustomRadioSelect widget"""
         choices = [('1', 'Option 1'), ('2', 'Option 2')]
@@ -49,12 +68,12 @@ class WidgetTestCase(TestCase):
         widget = StyledSelect()
         
         # Test default attributes
-        self.assertEqual(widget.attrs['class'], 'form-select')
-        self.assertIn('border-radius', widget.attrs['style'])
+        self.assertEqual(widget.attrs['class'], 'form-select sams-input')
+        self.assertNotIn('style', widget.attrs)
         
         # Test with custom attributes
         widget = StyledSelect(attrs={'data-test': 'value'})
-        self.assertEqual(widget.attrs['class'], 'form-select')
+        self.assertEqual(widget.attrs['class'], 'form-select sams-input')
         self.assertEqual(widget.attrs['data-test'], 'value')
     
     def test_searchable_select(self):
@@ -63,7 +82,7 @@ class WidgetTestCase(TestCase):
         
         # Test default attributes
         self.assertIn('searchable-select', widget.attrs['class'])
-        self.assertIn('border-radius', widget.attrs['style'])
+        self.assertNotIn('style', widget.attrs)
         
         # Test with custom attributes
         widget = SearchableSelect(attrs={'data-test': 'value'})
@@ -75,12 +94,12 @@ class WidgetTestCase(TestCase):
         widget = StyledTextInput()
         
         # Test default attributes
-        self.assertEqual(widget.attrs['class'], 'form-control')
-        self.assertIn('border-radius', widget.attrs['style'])
+        self.assertEqual(widget.attrs['class'], 'form-control sams-input')
+        self.assertNotIn('style', widget.attrs)
         
         # Test with custom attributes
         widget = StyledTextInput(attrs={'data-test': 'value'})
-        self.assertEqual(widget.attrs['class'], 'form-control')
+        self.assertEqual(widget.attrs['class'], 'form-control sams-input')
         self.assertEqual(widget.attrs['data-test'], 'value')
     
     def test_styled_email_input(self):
@@ -88,12 +107,12 @@ class WidgetTestCase(TestCase):
         widget = StyledEmailInput()
         
         # Test default attributes
-        self.assertEqual(widget.attrs['class'], 'form-control')
-        self.assertIn('border-radius', widget.attrs['style'])
+        self.assertEqual(widget.attrs['class'], 'form-control sams-input')
+        self.assertNotIn('style', widget.attrs)
         
         # Test with custom attributes
         widget = StyledEmailInput(attrs={'data-test': 'value'})
-        self.assertEqual(widget.attrs['class'], 'form-control')
+        self.assertEqual(widget.attrs['class'], 'form-control sams-input')
         self.assertEqual(widget.attrs['data-test'], 'value')
     
     def test_styled_number_input(self):
@@ -101,12 +120,12 @@ class WidgetTestCase(TestCase):
         widget = StyledNumberInput()
         
         # Test default attributes
-        self.assertEqual(widget.attrs['class'], 'form-control')
-        self.assertIn('border-radius', widget.attrs['style'])
+        self.assertEqual(widget.attrs['class'], 'form-control sams-input')
+        self.assertNotIn('style', widget.attrs)
         
         # Test with custom attributes
         widget = StyledNumberInput(attrs={'data-test': 'value'})
-        self.assertEqual(widget.attrs['class'], 'form-control')
+        self.assertEqual(widget.attrs['class'], 'form-control sams-input')
         self.assertEqual(widget.attrs['data-test'], 'value')
     
     def test_styled_textarea(self):
@@ -114,13 +133,13 @@ class WidgetTestCase(TestCase):
         widget = StyledTextarea()
         
         # Test default attributes
-        self.assertEqual(widget.attrs['class'], 'form-control')
-        self.assertIn('border-radius', widget.attrs['style'])
+        self.assertEqual(widget.attrs['class'], 'form-control sams-input')
+        self.assertNotIn('style', widget.attrs)
         self.assertEqual(widget.attrs['rows'], 4)
         
         # Test with custom attributes
         widget = StyledTextarea(attrs={'rows': 10, 'data-test': 'value'})
-        self.assertEqual(widget.attrs['class'], 'form-control')
+        self.assertEqual(widget.attrs['class'], 'form-control sams-input')
         self.assertEqual(widget.attrs['rows'], 10)
         self.assertEqual(widget.attrs['data-test'], 'value')
 